@@ -0,0 +1,638 @@
+"""교육 데이터 분석 엔진
+
+대시보드 페이지가 표시하는 값을 계산하는 순수 함수 모음입니다 (Streamlit 을 사용하지 않음).
+입력은 ingest 가 반환하는 테이블 dict 이고, 결과는 DataFrame / Series / 숫자로 이루어진 dict 입니다.
+대시보드는 결과를 캐시해서 화면에 그리기만 하고, 배치 작업이나 벤치마크는 같은 함수를 직접 호출합니다.
+
+    data = ingest.load_workbook('dashboard_template.xlsx')[0]
+    filtered = filter_dataset(data, Filters(months=('2025-06',)))
+    overview_metrics(filtered)['kpis']
+"""
+import re
+from collections import namedtuple
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+
+# 필터 조건 (program 은 프로그램명 또는 '전체', companies / months 는 선택한 값 튜플)
+Filters = namedtuple('Filters', ['program', 'companies', 'months'], defaults=('전체', (), ()))
+
+# program_id 기준으로 필터링하는 테이블 / 회사 기준으로 필터링하는 테이블
+PROGRAM_TABLES = ['program_info', 'learners', 'certification', 'budget', 'instructors', 'survey']
+COMPANY_TABLES = ['learners', 'survey']
+
+def group_positions(values):
+    """값별 행 위치(np.ndarray) dict를 반환 (결측값 제외, 값은 처음 등장한 순서)"""
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    positions = np.split(order[len(codes) - counts.sum():], np.cumsum(counts)[:-1])
+    return dict(zip(uniques, positions))
+
+def collect_positions(groups, keys):
+    """여러 키의 행 위치를 하나의 배열로 합침"""
+    arrays = [groups[key] for key in keys if key in groups]
+    return np.concatenate(arrays) if arrays else np.array([], dtype=np.intp)
+
+def filter_index(data, previous=None, unchanged=()):
+    """테이블별 program_id / 회사 / 연월 행 위치와 연월별 program_id 목록을 미리 계산
+
+    연월 행 위치(by_month)는 프로그램 연월 기준의 파티션으로, 기간 필터는 선택한 연월의
+    파티션만 읽습니다. previous 를 주면 unchanged 에 있는 테이블의 행 위치는 previous 의 것을 그대로 사용합니다.
+    """
+    program_info = data['program_info']
+    year_months = program_info['program_month'].dt.strftime('%Y-%m')
+
+    def positions(kind, key, column):
+        if previous is not None and key in unchanged:
+            return previous[kind][key]
+        return group_positions(data[key][column])
+
+    by_program = {key: positions('by_program', key, 'program_id') for key in PROGRAM_TABLES}
+    # 연월 -> program_id 목록 (프로그램 등장 순서 유지)
+    month_programs = {
+        month: program_info['program_id'].iloc[positions].tolist()
+        for month, positions in group_positions(year_months).items()
+    }
+
+    return {
+        'by_program': by_program,
+        'by_company': {key: positions('by_company', key, 'company') for key in COMPANY_TABLES},
+        # 테이블별 연월 파티션 (연월 -> 정렬된 행 위치)
+        'by_month': {
+            key: {
+                month: np.sort(collect_positions(by_program[key], program_ids))
+                for month, program_ids in month_programs.items()
+            }
+            for key in PROGRAM_TABLES
+        },
+        'month_programs': month_programs,
+        # 프로그램명 -> program_id (같은 이름이면 첫 번째 프로그램)
+        'program_ids': dict(zip(program_info['program_name'][::-1], program_info['program_id'][::-1])),
+    }
+
+# 집계 큐브 차원 (테이블별 group by 키)
+CUBE_DIMENSIONS = {
+    'learners': ['program_id', 'company', 'job_level'],
+    'survey': ['program_id', 'company', 'question_id', 'question_type', 'question_text'],
+    'ratings': ['program_id', 'company', 'rating'],
+    'instructors': ['program_id'],
+    'programs': ['program_id', 'month', 'job_category'],
+}
+
+# 큐브 테이블별 원본 테이블
+CUBE_SOURCES = {
+    'learners': 'learners',
+    'survey': 'survey',
+    'ratings': 'survey',
+    'instructors': 'instructors',
+    'programs': 'program_info',
+}
+
+def aggregate_cube(data, previous=None, unchanged=()):
+    """자주 쓰는 집계(건수 / 합계 / 제곱합)를 큐브 차원별로 미리 계산
+
+    previous 를 주면 원본 테이블이 unchanged 에 있는 큐브 테이블은 previous 의 것을 그대로 사용합니다.
+    """
+    survey = data['survey']
+    instructors = data['instructors']
+    program_info = data['program_info']
+
+    groupby_options = {'dropna': False, 'observed': True, 'sort': False}
+    builders = {
+        # 수강생 수
+        'learners': lambda: data['learners'].groupby(CUBE_DIMENSIONS['learners'], **groupby_options)
+            .size().reset_index(name='count'),
+        # 응답 수 / 평점 합계 / 평점 제곱합 (평균, 표준편차 계산용)
+        'survey': lambda: survey.assign(rating=survey['rating'].astype('float64'))
+            .assign(rating_sq=lambda df: df['rating'] ** 2)
+            .groupby(CUBE_DIMENSIONS['survey'], **groupby_options)
+            .agg(count=('rating', 'count'), rating_sum=('rating', 'sum'), rating_sq_sum=('rating_sq', 'sum'))
+            .reset_index(),
+        # 평점별 응답 수 (점수 분포 차트용)
+        'ratings': lambda: survey[survey['rating'].notna()]
+            .groupby(CUBE_DIMENSIONS['ratings'], **groupby_options)
+            .size().reset_index(name='count'),
+        # 강사료 합계 / 시간당 강사료(만원) 합계
+        'instructors': lambda: instructors.assign(hourly_rate=instructors['lecture_fee'] / instructors['lecture_hours'] / 10000)
+            .groupby(CUBE_DIMENSIONS['instructors'], **groupby_options)
+            .agg(lecture_fee=('lecture_fee', 'sum'), hourly_rate_sum=('hourly_rate', 'sum'),
+                 hourly_rate_count=('hourly_rate', 'count'))
+            .reset_index(),
+        # 월 / 직무분야별 프로그램 수
+        'programs': lambda: program_info.assign(month=program_info['program_month'].dt.month)
+            .groupby(CUBE_DIMENSIONS['programs'], **groupby_options)
+            .size().reset_index(name='count'),
+    }
+
+    return {
+        key: previous[key] if previous is not None and CUBE_SOURCES[key] in unchanged else build()
+        for key, build in builders.items()
+    }
+
+def slice_cube(cube, program_ids, companies):
+    """필터에 해당하는 큐브 셀만 남김 (program_ids 가 None 이면 프로그램 조건 없음)"""
+    sliced = {}
+    for key, cells in cube.items():
+        mask = pd.Series(True, index=cells.index)
+        if program_ids is not None:
+            mask &= cells['program_id'].isin(program_ids)
+        if len(companies) > 0 and 'company' in cells:
+            mask &= cells['company'].isin(companies)
+        sliced[key] = cells if mask.all() else cells[mask]
+    return sliced
+
+def rating_stats(survey_cube, by):
+    """설문 큐브에서 그룹별 평균 / 표준편차 / 응답 수 계산 (응답이 없는 그룹 제외)"""
+    grouped = survey_cube.groupby(by, observed=True)[['count', 'rating_sum', 'rating_sq_sum']].sum()
+    grouped = grouped[grouped['count'] > 0]
+
+    count = grouped['count']
+    mean = grouped['rating_sum'] / count
+    variance = ((grouped['rating_sq_sum'] - grouped['rating_sum'] * mean) / (count - 1)).clip(lower=0)
+    return pd.DataFrame({
+        'mean': mean,
+        'std': np.sqrt(variance.where(count > 1)),
+        'count': count
+    }).reset_index()
+
+def rating_mean(survey_cube):
+    """설문 큐브 전체의 평균 평점 (응답이 없으면 NaN)"""
+    count = survey_cube['count'].sum()
+    return survey_cube['rating_sum'].sum() / count if count > 0 else np.nan
+
+def program_bundles(data, index):
+    """program_id -> 프로그램 상세 화면에 필요한 값 dict (정보 / 예산 / 회사별 수강생 수 / 강사 / 자격증)
+
+    회사별 수강생 수는 회사 필터를 나중에 적용할 수 있도록 전체 수강생 기준으로 저장합니다.
+    """
+    by_program = index['by_program']
+    company_counts = data['learners'].groupby(['program_id', 'company'], sort=False, observed=True).size()
+    company_dists = {
+        program_id: counts.droplevel('program_id')
+        for program_id, counts in company_counts.groupby(level='program_id', sort=False, observed=True)
+    }
+
+    def first_row(key, program_id):
+        positions = by_program[key].get(program_id)
+        return None if positions is None else data[key].iloc[positions[0]]
+
+    bundles = {}
+    for program_id in by_program['program_info']:
+        instructors = data['instructors'].iloc[by_program['instructors'].get(program_id, [])]
+        bundles[program_id] = {
+            'info': first_row('program_info', program_id),
+            'budget': first_row('budget', program_id),
+            'company_dist': company_dists.get(program_id, pd.Series(dtype='int64')),
+            'instructors': pd.DataFrame({
+                '강사명': instructors['instructor_name'],
+                '강의시간': instructors['lecture_hours'],
+                '강사료(백만원)': (instructors['lecture_fee'] / 1000000).round(1),
+            }),
+            'certification': first_row('certification', program_id),
+        }
+    return bundles
+
+# 키워드로 사용할 한글 단어 패턴과 최소 글자 수
+HANGUL_WORD = re.compile(r'[가-힣]+')
+KEYWORD_MIN_LENGTH = 2
+
+def tokenize_comment(comment):
+    """코멘트에서 의미있는 키워드(2글자 이상 한글 단어) 목록 추출"""
+    return [word for word in HANGUL_WORD.findall(str(comment)) if len(word) >= KEYWORD_MIN_LENGTH]
+
+def token_index(data, memo=None, lock=None):
+    """설문 코멘트의 키워드 빈도를 행별 / (프로그램, 문항)별로 미리 계산
+
+    'rows' 는 설문 행(index) x 키워드별 빈도, 'groups' 는 (program_id, question_type, question_text) x 키워드별 빈도입니다.
+    first 는 전체 코멘트에서 키워드가 처음 등장한 순번으로, 빈도가 같을 때 먼저 나온 키워드를 앞에 둡니다.
+    memo 는 코멘트 원문 -> 키워드 목록 캐시(dict 처럼 get / 대입 가능한 객체)이고, 여러 스레드가 공유하면 lock 을 함께 줍니다.
+    """
+    survey = data['survey']
+    comments = survey['comment'].dropna()
+    memo = {} if memo is None else memo
+
+    labels, words = [], []
+    with lock or nullcontext():
+        for label, comment in comments.items():
+            tokens = memo.get(comment)
+            if tokens is None:
+                tokens = memo[comment] = tokenize_comment(comment)
+            labels.extend([label] * len(tokens))
+            words.extend(tokens)
+
+    entries = pd.DataFrame({
+        'row': np.asarray(labels, dtype=np.int64),
+        'token': pd.Categorical(words),
+        'first': np.arange(len(words), dtype=np.int64),
+    })
+    rows = entries.groupby(['row', 'token'], sort=False, observed=True).agg(
+        count=('first', 'size'), first=('first', 'min')).reset_index()
+
+    group_keys = ['program_id', 'question_type', 'question_text']
+    grouped = rows.join(survey[group_keys], on='row')
+    groups = grouped.groupby(group_keys + ['token'], sort=False, observed=True, dropna=False).agg(
+        count=('count', 'sum'), first=('first', 'min')).reset_index()
+
+    return {'rows': rows, 'groups': groups}
+
+def top_keywords(counts, k):
+    """키워드 빈도 표를 합쳐 빈도 상위 k개의 (키워드, 빈도) 목록 반환"""
+    merged = counts.groupby('token', observed=True).agg(count=('count', 'sum'), first=('first', 'min'))
+    merged = merged.sort_values(['count', 'first'], ascending=[False, True]).head(k)
+    return [(str(word), int(freq)) for word, freq in merged['count'].items()]
+
+def keyword_counts(data, survey_rows, question_type=None, question_text=None):
+    """설문 행(survey_rows)의 코멘트 키워드 빈도 표
+
+    회사 필터가 없으면 survey_rows 는 프로그램 / 문항 조건만으로 정해지므로 미리 합친 그룹 표를 사용합니다.
+    """
+    tokens = data['tokens']
+    if len(data['filters'].companies) > 0:
+        return tokens['rows'][tokens['rows']['row'].isin(survey_rows.index)]
+
+    groups = tokens['groups']
+    mask = groups['program_id'].isin(survey_rows['program_id'].unique())
+    if question_type is not None:
+        mask &= groups['question_type'] == question_type
+    if question_text is not None:
+        mask &= groups['question_text'] == question_text
+    return groups[mask]
+
+def prepare_dataset(data):
+    """필터링에 쓰는 인덱스 / 큐브 / 키워드 인덱스 / 프로그램 번들을 한 번에 생성 (캐시 없이 쓸 때)"""
+    index = filter_index(data)
+    return {
+        'index': index,
+        'cube': aggregate_cube(data),
+        'tokens': token_index(data),
+        'programs': program_bundles(data, index),
+    }
+
+def filter_dataset(data, filters=Filters(), derived=None):
+    """프로그램 / 회사 / 기간 필터를 적용한 테이블 dict를 반환
+
+    필터가 없는 테이블은 원본 DataFrame 을 그대로 참조합니다 (복사하지 않음).
+    derived 는 prepare_dataset 결과로, 주지 않으면 새로 만듭니다. 결과에는 필터 조건('filters'),
+    같은 조건의 큐브 셀('cube'), 키워드 인덱스('tokens'), 프로그램 번들('programs')이 함께 들어갑니다.
+    """
+    filter_program, filter_companies, filter_months = filters
+    derived = prepare_dataset(data) if derived is None else derived
+    filtered_data = dict(data)
+    index = derived['index']
+
+    # 프로그램 / 기간 필터 -> 남길 program_id 집합
+    program_ids = None
+    if filter_program != '전체':
+        program_ids = {index['program_ids'][filter_program]} if filter_program in index['program_ids'] else set()
+    if len(filter_months) > 0:
+        month_program_ids = {
+            program_id
+            for month in filter_months
+            for program_id in index['month_programs'].get(month, [])
+        }
+        program_ids = month_program_ids if program_ids is None else program_ids & month_program_ids
+
+    # 테이블별로 남길 행 위치를 교집합으로 구한 뒤 한 번에 take
+    for key in PROGRAM_TABLES:
+        positions = None
+        if filter_program == '전체' and len(filter_months) > 0:
+            # 기간 필터만 있으면 선택한 연월 파티션만 합침
+            positions = collect_positions(index['by_month'][key], filter_months)
+        elif program_ids is not None:
+            positions = collect_positions(index['by_program'][key], program_ids)
+        if len(filter_companies) > 0 and key in COMPANY_TABLES:
+            company_positions = collect_positions(index['by_company'][key], filter_companies)
+            positions = company_positions if positions is None else np.intersect1d(positions, company_positions)
+
+        if positions is not None:
+            filtered_data[key] = data[key].take(np.sort(positions))
+
+    filtered_data['filters'] = Filters(*filters)
+    filtered_data['index'] = index
+    filtered_data['cube'] = slice_cube(derived['cube'], program_ids, filter_companies)
+    filtered_data['tokens'] = derived['tokens']
+    filtered_data['programs'] = derived['programs']
+    return filtered_data
+
+# 평점 척도 (분포 차트는 응답이 없는 점수도 0건으로 표시)
+RATING_SCALE = [1, 2, 3, 4, 5]
+
+def rating_distribution(rating_cells):
+    """평점 큐브 셀을 점수별 응답 수로 합산 (브라우저에서 구간을 나누지 않도록 서버에서 집계)"""
+    counts = rating_cells.groupby('rating', observed=True)['count'].sum()
+    scale = sorted(set(RATING_SCALE) | set(counts.index))
+    return counts.reindex(scale, fill_value=0).rename_axis('rating').reset_index(name='count')
+
+# 수강생 상세 리스트 한 페이지의 행 수
+LEARNER_PAGE_SIZE = 50
+# 상세 리스트 표시 컬럼 -> 표시 이름
+LEARNER_COLUMNS = {
+    'learner_id': '수강생ID',
+    'program_name': '프로그램',
+    'company': '회사',
+    'dept': '부서',
+    'job_level': '직급',
+}
+
+def prefix_index(values):
+    """앞부분 일치 검색용 (소문자로 정렬한 값 배열, 정렬 순서의 행 위치) 튜플"""
+    keys = values.astype('string').fillna('').str.lower().to_numpy(dtype=str)
+    order = np.argsort(keys, kind='stable')
+    return keys[order], order
+
+def prefix_positions(index, prefix):
+    """prefix 로 시작하는 값의 행 위치 (이진 탐색)"""
+    keys, order = index
+    prefix = prefix.lower()
+    start = np.searchsorted(keys, prefix, side='left')
+    end = np.searchsorted(keys, prefix + '\U0010ffff', side='left')
+    return order[start:end]
+
+def build_learner_browser(data):
+    """수강생 상세 리스트 테이블과 회사 / 프로그램 / 직급 / 검색 인덱스를 생성"""
+    table = data['learners'].merge(
+        data['program_info'][['program_id', 'program_name']], on='program_id'
+    )[list(LEARNER_COLUMNS)]
+    return {
+        'table': table,
+        'company': group_positions(table['company']),
+        'program_name': group_positions(table['program_name']),
+        'job_level': group_positions(table['job_level']),
+        'search': [prefix_index(table['learner_id']), prefix_index(table['dept'])],
+    }
+
+def search_learners(browser, conditions, query):
+    """조건(컬럼 -> 값, '전체'는 조건 없음)과 검색어에 맞는 행 위치 (원본 순서, 조건이 없으면 None)"""
+    positions = None
+    for column, value in conditions.items():
+        if value == '전체':
+            continue
+        matched = browser[column].get(value, np.array([], dtype=np.intp))
+        positions = matched if positions is None else np.intersect1d(positions, matched)
+
+    query = query.strip()
+    if query:
+        matched = np.union1d(*(prefix_positions(index, query) for index in browser['search']))
+        positions = matched if positions is None else np.intersect1d(positions, matched)
+
+    return positions if positions is None else np.sort(positions)
+
+def learner_page(browser, positions, page, page_size=LEARNER_PAGE_SIZE):
+    """검색 결과 중 page 번째 (1부터) 페이지의 행만 반환"""
+    window = slice((page - 1) * page_size, page * page_size)
+    if positions is None:
+        return browser['table'].iloc[window]
+    return browser['table'].take(positions[window])
+
+# 페이지별 분석 결과 (filter_dataset 결과를 받아 화면에 그릴 값만 반환, 결과는 수정하지 않고 공유)
+
+# Overview 고정 축: 1-12월, 11개 직무분야
+MONTH_LABELS = [f"{month}월" for month in range(1, 13)]
+JOB_CATEGORIES = ['전략', '사업개발', '재무', 'HR', '마케팅', 'Sales', '법무', 'IP', '구매/SCM', 'SVESG', '일하는 방식']
+# 만족도 질문 ID -> 짧은 이름
+QUESTION_LABELS = {
+    'Q1': '전반적 만족도',
+    'Q2': '추천 의향',
+    'Q3': '실무 도움도'
+}
+
+def overview_metrics(data):
+    """전체 현황: KPI / 월별 프로그램 수 / 직무분야별 프로그램 수 / 프로그램 요약 표"""
+    cube = data['cube']
+    budget = data['budget']
+    kpis = {
+        'programs': len(data['program_info']),
+        'learners': int(cube['learners']['count'].sum()),
+        'budget': budget['actual_budget'].sum() / 1000000 if len(budget) > 0 else 0,
+        'direct_cost': budget['total_direct_cost'].sum() / 1000000 if len(budget) > 0 else 0,
+        'satisfaction': rating_mean(cube['survey']) if len(data['survey']) > 0 else 0,
+    }
+
+    # 1-12월 고정 (데이터가 없는 달은 0)
+    monthly = pd.DataFrame({'month': range(1, 13), 'month_str': MONTH_LABELS})
+    monthly_count = cube['programs'].groupby('month')['count'].sum().reset_index(name='프로그램 수')
+    monthly = monthly.merge(monthly_count, on='month', how='left')
+    monthly['프로그램 수'] = monthly['프로그램 수'].fillna(0)
+
+    # 11개 직무분야 고정
+    job_programs = cube['programs'].groupby('job_category')['count'].sum().reset_index(name='프로그램 수')
+    jobs = pd.DataFrame({'job_category': JOB_CATEGORIES}).merge(job_programs, on='job_category', how='left')
+    jobs['프로그램 수'] = jobs['프로그램 수'].fillna(0)
+
+    # 프로그램 요약 표
+    program_summary = data['program_info'].merge(budget, on='program_id')
+    satisfaction_by_program = rating_stats(cube['survey'], 'program_id')[['program_id', 'mean']]
+    satisfaction_by_program.columns = ['program_id', 'avg_satisfaction']
+    program_summary = program_summary.merge(satisfaction_by_program, on='program_id', how='left')
+
+    summary = program_summary[['program_name', 'job_category', 'num_learners',
+                               'actual_budget', 'total_direct_cost', 'avg_satisfaction']].copy()
+    summary['actual_budget'] = (summary['actual_budget'] / 1000000).round(1)
+    summary['total_direct_cost'] = (summary['total_direct_cost'] / 1000000).round(1)
+    summary['avg_satisfaction'] = summary['avg_satisfaction'].round(2)
+    summary.columns = ['프로그램명', '직무분야', '수강생수', '예산(백만원)', '직접비(백만원)', '만족도']
+
+    return {'kpis': kpis, 'monthly': monthly, 'jobs': jobs, 'summary': summary}
+
+def program_detail(data, program_name):
+    """프로그램 상세: 미리 계산한 번들에 회사 필터를 적용 (프로그램이 없으면 None)
+
+    회사별 분포는 수강생이 많은 상위 10개사이고, 자격증이 없으면 'certification' 이 None 입니다.
+    """
+    bundle = data['programs'].get(data['index']['program_ids'].get(program_name))
+    if bundle is None:
+        return None
+
+    company_dist = bundle['company_dist']
+    companies = data['filters'].companies
+    if len(companies) > 0:
+        company_dist = company_dist[company_dist.index.isin(companies)]
+
+    certification = bundle['certification']
+    pass_rate = None
+    if certification is not None:
+        candidates = certification['exam_candidates']
+        pass_rate = certification['exam_passed'] / candidates * 100 if candidates else np.nan
+    return {
+        'info': bundle['info'],
+        'budget': bundle['budget'],
+        'company_dist': company_dist.sort_values(ascending=False).head(10),
+        'instructors': bundle['instructors'],
+        'certification': certification,
+        'pass_rate': pass_rate,
+    }
+
+OTHER_LABEL = '기타'
+
+def _top_rows(matrix, keep, other):
+    # 합계가 큰 keep - 1 개 행만 남기고 나머지 행은 other 행으로 합침
+    if len(matrix) <= keep:
+        return matrix
+    order = matrix.sum(axis=1).sort_values(ascending=False, kind='stable').index
+    rest = matrix.loc[order[keep - 1:]].sum().to_frame(other).T
+    return pd.concat([matrix.loc[order[:keep - 1]], rest])
+
+def cap_matrix(matrix, max_cells, other=OTHER_LABEL):
+    """행 x 열이 max_cells 셀 이하가 되도록 합계가 큰 행 / 열만 남기고 나머지는 other 행 / 열로 합침 (건수 행렬용)"""
+    rows, cols = matrix.shape
+    if rows * cols <= max_cells:
+        return matrix
+    # 행 / 열 비율을 유지하면서 줄임
+    keep_rows = min(rows, max(1, int(rows * np.sqrt(max_cells / (rows * cols)))))
+    keep_cols = min(cols, max(1, max_cells // keep_rows))
+    return _top_rows(_top_rows(matrix, keep_rows, other).T, keep_cols, other).T
+
+def learner_summary(data):
+    """수강생 분석: 회사별 (Top 10) / 직급별 수강생 수, 프로그램 x 회사 히트맵, 상세 리스트 조회 인덱스"""
+    learner_cells = data['cube']['learners']
+    companies = learner_cells.groupby('company', sort=False, observed=True)['count'].sum()
+    levels = learner_cells.groupby('job_level', sort=False, observed=True)['count'].sum()
+
+    heatmap = learner_cells.merge(data['program_info'][['program_id', 'program_name']], on='program_id')
+    heatmap = heatmap.groupby(['program_name', 'company'], observed=True)['count'].sum().reset_index()
+
+    return {
+        'companies': companies[companies > 0].sort_values(ascending=False).head(10),
+        'levels': levels[levels > 0].sort_values(ascending=False),
+        'heatmap': heatmap.pivot(index='company', columns='program_name', values='count').fillna(0),
+        'browser': build_learner_browser(data),
+        # 상세 리스트 필터 선택지
+        'options': {
+            'company': data['learners']['company'].dropna().unique().tolist(),
+            'program_name': data['program_info']['program_name'].unique().tolist(),
+            'job_level': data['learners']['job_level'].dropna().unique().tolist(),
+        },
+    }
+
+def budget_breakdown(data):
+    """예산 분석: 합계 KPI / 프로그램별 예산 비교 / 항목별 분포 / 직접비 효율성 / 강사료 (금액 단위는 백만원)"""
+    budget = data['budget']
+    totals = {
+        'budget': budget['actual_budget'].sum() / 1000000,
+        'direct_cost': budget['total_direct_cost'].sum() / 1000000,
+        'dev_cost': budget['dev_cost'].sum() / 1000000,
+        'instructor_fee': budget['instructor_fee'].sum() / 1000000,
+        'reserve_fund': budget['reserve_fund'].sum() / 1000000,
+    }
+    totals['avg_budget'] = totals['budget'] / len(data['program_info'])
+    totals['budget_ratio'] = totals['budget'] / (totals['budget'] + totals['direct_cost']) * 100
+    # 1인당 직접비 (천원)
+    totals['per_person_cost'] = budget['direct_cost'].mean() / 1000
+
+    # 프로그램별 예산 vs 직접비 (program_id 유지)
+    comparison = budget.merge(data['program_info'][['program_id', 'program_name']], on='program_id', how='left')
+
+    # 프로그램별 예산 항목 (같은 이름이면 첫 번째 프로그램)
+    components = comparison.drop_duplicates('program_name')
+    components = pd.DataFrame({
+        'program_name': components['program_name'],
+        'dev_cost': components['dev_cost'] / 1000000,
+        'instructor_fee': components['instructor_fee'] / 1000000,
+        'reserve_fund': components['reserve_fund'] / 1000000,
+    })
+
+    # 프로그램별 직접비 효율성 표
+    efficiency = budget.merge(data['program_info'][['program_id', 'program_name', 'num_learners']], on='program_id')
+    efficiency['직접비_비율'] = (efficiency['total_direct_cost'] /
+                              (efficiency['actual_budget'] + efficiency['total_direct_cost']) * 100)
+    efficiency = efficiency[['program_name', 'num_learners', 'direct_cost', 'total_direct_cost', '직접비_비율']].copy()
+    efficiency['direct_cost'] = (efficiency['direct_cost'] / 1000).round(0)
+    efficiency['total_direct_cost'] = (efficiency['total_direct_cost'] / 1000000).round(1)
+    efficiency['직접비_비율'] = efficiency['직접비_비율'].round(1)
+    efficiency.columns = ['프로그램', '수강생수', '1인당(천원)', '총액(백만원)', '비율(%)']
+
+    # 프로그램별 강사료 총액 / 평균 시간당 강사료(만원)
+    instructors = data['cube']['instructors'].merge(
+        data['program_info'][['program_id', 'program_name']], on='program_id')
+    instructors = instructors.groupby('program_name')[['lecture_fee', 'hourly_rate_sum', 'hourly_rate_count']].sum()
+    instructor_fees = instructors['lecture_fee'].reset_index()
+    instructor_fees['lecture_fee'] = (instructor_fees['lecture_fee'] / 1000000).round(1)
+    hourly_rates = (instructors['hourly_rate_sum'] / instructors['hourly_rate_count']).reset_index(name='hourly_rate')
+
+    return {
+        'totals': totals,
+        'comparison': comparison,
+        'components': components,
+        'efficiency': efficiency,
+        'instructor_fees': instructor_fees,
+        'hourly_rates': hourly_rates,
+    }
+
+def satisfaction_summary(data, program_name='전체'):
+    """만족도 분석 (program_name 이 '전체'면 프로그램 / 문항 / 회사별 비교, 아니면 해당 프로그램 상세)
+
+    코멘트 표본 추출은 화면마다 달라야 하므로 하지 않고 'comments' 에 전체 코멘트를 담습니다.
+    """
+    survey_cube = data['cube']['survey']
+    survey = data['survey']
+
+    if program_name == '전체':
+        programs = survey_cube.merge(data['program_info'][['program_id', 'program_name']], on='program_id')
+        by_program = rating_stats(programs, 'program_name')[['program_name', 'mean']]
+        by_program.columns = ['program_name', 'rating']
+
+        by_question = rating_stats(survey_cube, 'question_id')
+        by_question['question_short'] = by_question['question_id'].map(QUESTION_LABELS)
+
+        # 5개 이상 응답한 회사 중 상위 15개사
+        by_company = rating_stats(survey_cube, 'company')
+        by_company = by_company[by_company['count'] >= 5].sort_values('mean', ascending=False).head(15)
+
+        return {
+            'label': '전체',
+            'overall': rating_mean(survey_cube),
+            'by_program': by_program,
+            'by_question': by_question,
+            'by_company': by_company,
+            'comments': survey[survey['comment'].notna()]['comment'],
+            'keywords': top_keywords(keyword_counts(data, survey), 15),
+        }
+
+    program_id = data['index']['program_ids'][program_name]
+    survey_cube = survey_cube[survey_cube['program_id'] == program_id]
+    rating_cells = data['cube']['ratings'][data['cube']['ratings']['program_id'] == program_id]
+    survey = survey[survey['program_id'] == program_id]
+
+    # 객관식 문항별 평균 / 표준편차 / 응답 수
+    questions = rating_stats(survey_cube[survey_cube['question_type'] == '객관식'], ['question_id', 'question_text'])
+    questions['question_short'] = questions['question_id'].map(QUESTION_LABELS)
+
+    # 주관식 문항별 코멘트와 상위 키워드 (미리 계산한 키워드 빈도 사용)
+    subjective = survey[(survey['question_type'] == '주관식') & (survey['comment'].notna())]
+    comments = []
+    for question in subjective['question_text'].unique():
+        question_rows = subjective[subjective['question_text'] == question]
+        keywords = top_keywords(
+            keyword_counts(data, question_rows, question_type='주관식', question_text=question), 10)
+        comments.append({'question': question, 'comments': question_rows['comment'], 'keywords': keywords})
+
+    # 3개 이상 응답한 회사
+    by_company = rating_stats(survey_cube, 'company')[['company', 'mean', 'count']]
+    by_company = by_company[by_company['count'] >= 3].sort_values('mean', ascending=False)
+
+    return {
+        'label': program_name,
+        'overall': rating_mean(survey_cube),
+        'questions': questions,
+        'distribution': rating_distribution(rating_cells),
+        'subjective': comments,
+        'by_company': by_company,
+    }
+
+def page_results(data):
+    """filter_dataset 결과 하나로 그릴 수 있는 모든 페이지 결과: 결과 이름 -> 계산 함수 (사전 계산용)
+
+    이름은 대시보드 페이지 결과 캐시의 이름과 같습니다 (프로그램별 결과는 'program:이름', 'satisfaction:이름').
+    """
+    results = {
+        'overview': overview_metrics,
+        'learners': learner_summary,
+        'budget': budget_breakdown,
+        'satisfaction:전체': satisfaction_summary,
+    }
+    for name in dict.fromkeys(data['program_info']['program_name'].tolist()):
+        results[f"program:{name}"] = lambda data, name=name: program_detail(data, name)
+        results[f"satisfaction:{name}"] = lambda data, name=name: satisfaction_summary(data, name)
+    return results
@@ -0,0 +1,354 @@
+"""대시보드 성능 벤치마크
+
+대시보드와 같은 6개 시트 구조의 합성 워크북을 원하는 크기로 만들고,
+브라우저 없이(Streamlit bare 모드) 데이터 로드 / 분석 엔진 / 필터 적용 / 페이지별 계산 시간을 측정해 JSON 으로 저장합니다.
+
+사용 예:
+    python benchmark.py --sizes 100 10000 1000000 --output bench.json
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+# 합성 워크북 기본 저장 위치
+WORK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.benchmark')
+
+JOB_CATEGORIES = ['전략', '사업개발', '재무', 'HR', '마케팅', 'Sales', '법무', 'IP', '구매/SCM', 'SVESG', '일하는 방식']
+COMPANIES = [f"SK{name}" for name in (
+    '이노베이션', '텔레콤', '하이닉스', '네트웍스', '에너지', '온', '스퀘어', '디스커버리', '케미칼', '바이오팜',
+    '실트론', '머티리얼즈', '가스', '에코플랜트', '매직', '렌터카', '브로드밴드', '플래닛', '쉴더스', '텔링크',
+)] + ['워커힐', '11번가', '티맵모빌리티']
+JOB_LEVELS = ['팀원', '팀장', '임원']
+OWNERS = ['박수영', '김민준', '이서연', '최지훈', '정하은']
+VENUES = ['그랑서울 24', '중강의장 1', '대강의장', '온라인', '연수원']
+OBJECTIVE_QUESTIONS = [
+    ('Q1', '과정의 강의는 전반적으로 만족스러웠다.'),
+    ('Q2', '과정을 다른 사람에게도 추천해주고 싶다.'),
+    ('Q3', '과정에서 배운 내용이 실무에 도움이 된다.'),
+]
+SUBJECTIVE_QUESTIONS = [
+    ('Q4', '과정에서 가장 좋았던 점은 무엇입니까?'),
+    ('Q5', '과정에서 개선이 필요한 점은 무엇입니까?'),
+]
+COMMENT_WORDS = ['강의', '실무', '사례', '토론', '강사님', '내용', '시간', '구성', '실습', '도움',
+                 '유익', '만족', '네트워킹', '부족', '자료', '진행', '난이도', '현업', '적용', '추천']
+
+# 측정할 필터 조합: 이름 -> (프로그램 필터 사용 여부, 회사 수, 월 수)
+FILTER_CASES = {
+    'none': (False, 0, 0),
+    'program': (True, 0, 0),
+    'companies': (False, 3, 0),
+    'months': (False, 0, 2),
+    'combined': (True, 3, 2),
+}
+
+
+def generate_workbook(path, survey_rows, seed=0):
+    """survey_rows 개의 설문 응답을 가진 합성 워크북을 생성합니다.
+
+    나머지 시트는 설문 규모에 비례해 만듭니다 (수강생 = 설문 / 3, 프로그램 = 설문 / 100, 최대 500개).
+    """
+    rng = np.random.default_rng(seed)
+    num_programs = int(min(500, max(5, survey_rows // 100)))
+    num_learners = int(max(num_programs, survey_rows // 3))
+
+    program_ids = np.array([f"P{i:04d}" for i in range(1, num_programs + 1)])
+    program_names = np.array([f"합성 교육과정 {i}" for i in range(1, num_programs + 1)])
+
+    learner_programs = rng.integers(0, num_programs, num_learners)
+    learners = pd.DataFrame({
+        'learner_id': [f"L{i:07d}" for i in range(1, num_learners + 1)],
+        'program_id': program_ids[learner_programs],
+        'company': rng.choice(COMPANIES, num_learners),
+        'dept': np.where(rng.random(num_learners) < 0.3, None,
+                         np.char.add('부서', rng.integers(1, 400, num_learners).astype(str))),
+        'job_level': rng.choice(JOB_LEVELS, num_learners, p=[0.8, 0.15, 0.05]),
+    })
+
+    program_info = pd.DataFrame({
+        'program_id': program_ids,
+        'program_name': program_names,
+        'job_category': rng.choice(JOB_CATEGORIES, num_programs),
+        'owner': rng.choice(OWNERS, num_programs),
+        'program_month': pd.to_datetime([f"2025-{month:02d}-01" for month in rng.integers(1, 13, num_programs)]),
+        'duration_days': rng.integers(1, 6, num_programs),
+        'target_company': rng.choice(['전체', 'SK이노베이션', 'SK텔레콤'], num_programs),
+        'num_learners': np.bincount(learner_programs, minlength=num_programs).astype(float),
+        'venue': rng.choice(VENUES, num_programs),
+    })
+
+    certified = rng.random(num_programs) < 0.8
+    candidates = rng.integers(10, 40, int(certified.sum()))
+    certification = pd.DataFrame({
+        'program_id': program_ids[certified],
+        'certification_type': program_names[certified],
+        'exam_candidates': candidates.astype(float),
+        'exam_passed': (candidates * rng.uniform(0.5, 1.0, len(candidates))).round().astype(float),
+    })
+
+    dev_cost = rng.integers(1, 30, num_programs) * 1000000.0
+    instructor_fee = rng.integers(1, 20, num_programs) * 1000000.0
+    reserve_fund = rng.integers(0, 10, num_programs) * 1000000.0
+    budget = pd.DataFrame({
+        'program_id': program_ids,
+        'total_budget': dev_cost + instructor_fee + reserve_fund,
+        'dev_cost': dev_cost,
+        'instructor_fee': instructor_fee,
+        'reserve_fund': reserve_fund,
+        'direct_cost': rng.integers(2, 12, num_programs) * 100000.0,
+    })
+
+    instructors_per_program = rng.integers(1, 4, num_programs)
+    instructor_programs = np.repeat(np.arange(num_programs), instructors_per_program)
+    instructors = pd.DataFrame({
+        'program_id': program_ids[instructor_programs],
+        'instructor_id': [f"I{i:02d}" for count in instructors_per_program for i in range(1, count + 1)],
+        'instructor_name': [f"강사{i}" for i in rng.integers(1, 200, len(instructor_programs))],
+        'lecture_hours': rng.integers(2, 33, len(instructor_programs)).astype(float),
+        'lecture_fee': rng.integers(1, 10, len(instructor_programs)) * 1000000.0,
+    })
+
+    questions = OBJECTIVE_QUESTIONS + SUBJECTIVE_QUESTIONS
+    survey_learners = rng.integers(0, num_learners, survey_rows)
+    question_index = rng.integers(0, len(questions), survey_rows)
+    objective = question_index < len(OBJECTIVE_QUESTIONS)
+    survey_programs = learner_programs[survey_learners]
+    comment_words = rng.choice(COMMENT_WORDS, (survey_rows, 4))
+    survey = pd.DataFrame({
+        'program_id': program_ids[survey_programs],
+        'company': learners['company'].to_numpy()[survey_learners],
+        'question_id': [questions[i][0] for i in question_index],
+        'question_text': [
+            f"{i + 1}. [{program_names[program]}] {questions[i][1]}"
+            for program, i in zip(survey_programs, question_index)
+        ],
+        'question_type': np.where(objective, '객관식', '주관식'),
+        'rating': np.where(objective, rng.choice([1, 2, 3, 4, 5], survey_rows, p=[0.02, 0.03, 0.1, 0.35, 0.5]), np.nan),
+        'comment': np.where(objective, None, [' '.join(words) + '이 좋았습니다' for words in comment_words]),
+    })
+
+    sheets = {
+        'Program_Info': program_info,
+        'Learners': learners,
+        'Certification': certification,
+        'Budget': budget,
+        'Instructors': instructors,
+        'Survey': survey,
+    }
+    write_workbook(path, sheets)
+    return path
+
+
+def write_workbook(path, sheets):
+    """시트명 -> DataFrame 을 xlsx 로 저장 (행 단위 스트리밍으로 큰 시트도 메모리를 적게 사용)"""
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+    try:
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, df.columns.tolist())
+            columns = [df[column].tolist() for column in df.columns]
+            for row_number, row in enumerate(zip(*columns), start=1):
+                for column_number, value in enumerate(row):
+                    if value is None or (isinstance(value, float) and math.isnan(value)):
+                        continue
+                    if isinstance(value, pd.Timestamp):
+                        worksheet.write_datetime(row_number, column_number, value.to_pydatetime(), date_format)
+                    else:
+                        worksheet.write(row_number, column_number, value)
+    finally:
+        workbook.close()
+
+
+def workbook_path(survey_rows, work_dir=WORK_DIR, seed=0):
+    """크기별 합성 워크북 경로 (없으면 생성)"""
+    os.makedirs(work_dir, exist_ok=True)
+    path = os.path.join(work_dir, f"synthetic_{survey_rows}_{seed}.xlsx")
+    if not os.path.exists(path):
+        generate_workbook(path, survey_rows, seed)
+    return path
+
+
+def measure(func, repeat):
+    """func 을 처음 한 번(cold)과 이후 repeat 번(warm) 실행한 시간(초)"""
+    started = time.perf_counter()
+    func()
+    cold = time.perf_counter() - started
+
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        warm.append(time.perf_counter() - started)
+    return {'cold': cold, 'warm_median': statistics.median(warm) if warm else None, 'warm': warm}
+
+
+def set_filters(data, case):
+    """FILTER_CASES 조합을 session_state 에 설정"""
+    import streamlit as st
+
+    use_program, num_companies, num_months = FILTER_CASES[case]
+    program_info = data['program_info']
+    st.session_state['filter_program'] = program_info['program_name'].iloc[0] if use_program else '전체'
+    st.session_state['filter_companies'] = data['learners']['company'].dropna().unique()[:num_companies].tolist()
+    # 첫 번째 프로그램의 월부터 선택 (프로그램 필터와 겹치도록)
+    months = program_info['program_month'].dt.strftime('%Y-%m').unique()
+    st.session_state['filter_months'] = months[:num_months].tolist()
+
+
+def quiet_streamlit():
+    """bare 모드 실행 시 Streamlit 경고 로그를 숨김"""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith('streamlit'):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def clear_caches():
+    """Streamlit 캐시를 모두 비움 (cold 측정용)"""
+    import streamlit as st
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def run_benchmark(survey_rows, repeat, work_dir=WORK_DIR):
+    """한 크기의 워크북에 대해 단계별 시간을 측정해 결과 목록으로 반환"""
+    import ingest
+
+    path = workbook_path(survey_rows, work_dir)
+    results = []
+
+    default_cache_dir = ingest.CACHE_DIR
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ingest.CACHE_DIR = cache_dir
+        digest = ingest.file_digest(path)
+
+        # 워크북 파싱 (디스크 캐시 없음) / 디스크 캐시 적중
+        started = time.perf_counter()
+        data, timings = ingest.load_workbook(path, digest)
+        results.append({'stage': 'load', 'name': 'parse', 'seconds': time.perf_counter() - started,
+                        'detail': timings})
+        started = time.perf_counter()
+        data, timings = ingest.load_workbook(path, digest)
+        results.append({'stage': 'load', 'name': 'disk_cache', 'seconds': time.perf_counter() - started,
+                        'detail': timings})
+    ingest.CACHE_DIR = default_cache_dir
+
+    # 파싱 방식별 시간 / 최대 메모리 (tracemalloc 으로 측정하므로 시간은 위 parse 보다 느림)
+    for streaming in (False, True):
+        tracemalloc.start()
+        started = time.perf_counter()
+        ingest.read_workbook(path, streaming=streaming)
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({'stage': 'load', 'name': 'read_stream' if streaming else 'read_pandas',
+                        'seconds': seconds, 'detail': {'peak_mib': round(peak / 1024 / 1024, 1)}})
+
+    data['version'] = digest
+    data['load_timings'] = timings
+
+    # 분석 엔진 단독 (Streamlit 캐시 없이 인덱스 생성 / 필터 / 페이지별 집계)
+    import analytics
+
+    timing = measure(lambda: analytics.prepare_dataset(data), repeat)
+    results.append({'stage': 'analytics', 'name': 'prepare', 'seconds': timing['warm_median'], 'detail': timing})
+    filtered = analytics.filter_dataset(data, derived=analytics.prepare_dataset(data))
+    first_program = data['program_info']['program_name'].iloc[0]
+    engine_pages = {
+        'overview_metrics': analytics.overview_metrics,
+        'program_detail': lambda filtered: analytics.program_detail(filtered, first_program),
+        'learner_summary': analytics.learner_summary,
+        'budget_breakdown': analytics.budget_breakdown,
+        'satisfaction_summary': analytics.satisfaction_summary,
+        'satisfaction_program': lambda filtered: analytics.satisfaction_summary(filtered, first_program),
+    }
+    for name, compute in engine_pages.items():
+        timing = measure(lambda: compute(filtered), repeat)
+        results.append({'stage': 'analytics', 'name': name, 'seconds': timing['warm_median'], 'detail': timing})
+
+    import dashboard
+    quiet_streamlit()
+
+    # 필터 적용 (cold: 인덱스 / 큐브 생성 포함, warm: 필터 조합 캐시 사용 전의 순수 필터링)
+    clear_caches()
+    for case in FILTER_CASES:
+        set_filters(data, case)
+        values = dashboard.get_filter_values()
+        timing = measure(lambda: dashboard.filter_data(data, *values), repeat)
+        results.append({'stage': 'filter', 'name': case, 'seconds': timing['warm_median'], 'detail': timing})
+
+    # 페이지별 계산 (필터 없음, 페이지 캐시를 비운 상태에서 측정)
+    set_filters(data, 'none')
+    filtered_data = dashboard.apply_filters(data)
+    for page, (_, _, render) in dashboard.PAGES.items():
+        def render_page():
+            dashboard.get_page_cache()[0].clear()
+            render(filtered_data)
+
+        timing = measure(render_page, repeat)
+        results.append({'stage': 'page', 'name': page, 'seconds': timing['warm_median'], 'detail': timing})
+
+    for result in results:
+        result['survey_rows'] = survey_rows
+    return results
+
+
+def git_commit():
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 성능 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10000],
+                        help="설문 응답 행 수 목록 (예: 100 10000 1000000)")
+    parser.add_argument('--repeat', type=int, default=3, help="warm 측정 반복 횟수")
+    parser.add_argument('--output', default='bench_output.json', help="결과 JSON 파일 경로")
+    parser.add_argument('--work-dir', default=WORK_DIR, help="합성 워크북 저장 위치")
+    args = parser.parse_args(argv)
+
+    results = []
+    for survey_rows in args.sizes:
+        print(f"▶ 설문 {survey_rows:,}행 측정 중...", file=sys.stderr)
+        results.extend(run_benchmark(survey_rows, args.repeat, args.work_dir))
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for result in results:
+        print(f"{result['survey_rows']:>9,} {result['stage']:<9} {result['name']:<20} {result['seconds']:.4f}s")
+    print(f"결과 저장: {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
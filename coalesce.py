@@ -0,0 +1,61 @@
+"""진행 중인 같은 계산 합치기 (single-flight)
+
+여러 스레드가 같은 키의 값을 동시에 요청하면 먼저 시작한 한 스레드만 계산하고 나머지는 그 결과를 받습니다.
+결과를 보관하지 않으므로 캐시와 함께 사용합니다 (대시보드의 필터 / 페이지 결과 캐시).
+
+    flight = SingleFlight()
+    result, coalesced = flight.do(('page', 'overview'), compute)
+"""
+import threading
+
+
+class SingleFlight:
+    """같은 키의 계산이 이미 진행 중이면 새로 시작하지 않고 그 계산의 결과를 기다림
+
+    같은 필터 / 페이지를 동시에 연 세션들이 한 번만 계산합니다. 키의 첫 값이 계산 종류이며,
+    counters 는 종류별로 직접 계산한 횟수('computed')와 다른 세션의 계산 결과를 받은 횟수('coalesced')입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.counters = {}
+
+    def _count(self, kind, name):
+        with self._lock:
+            self.counters.setdefault(kind, {'computed': 0, 'coalesced': 0})[name] += 1
+
+    def do(self, key, func):
+        """key 의 계산 결과와 다른 호출의 결과를 받았는지 여부 (result, coalesced) 를 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event(), 'result': None, 'failed': False}
+
+        if not leader:
+            call['done'].wait()
+            if not call['failed']:
+                self._count(key[0], 'coalesced')
+                return call['result'], True
+            # 먼저 시작한 계산이 실패했거나 그 실행이 중단되었으면 직접 계산
+            self._count(key[0], 'computed')
+            return func(), False
+
+        self._count(key[0], 'computed')
+        try:
+            call['result'] = func()
+        except BaseException:
+            call['failed'] = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+        return call['result'], False
+
+    def snapshot(self):
+        """종류별 카운터와 현재 진행 중인 계산 수"""
+        with self._lock:
+            return {'in_flight': len(self._calls),
+                    **{kind: dict(counts) for kind, counts in self.counters.items()}}
@@ -5,11 +5,44 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
-from collections import Counter
-import re
+import cProfile
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from cachetools import LRUCache
+from types import MappingProxyType
 warnings.filterwarnings('ignore')
 
+from ingest import (SHEETS, WorkbookError, file_digest, list_workbooks, load_directory, load_workbook,
+                    reload_workbook, sheet_digests)
+from analytics import (LEARNER_COLUMNS, LEARNER_PAGE_SIZE, MONTH_LABELS, PROGRAM_TABLES, Filters,
+                       aggregate_cube, budget_breakdown, cap_matrix, filter_dataset, filter_index,
+                       learner_page, learner_summary, overview_metrics, page_results, program_bundles,
+                       program_detail, satisfaction_summary, search_learners, token_index)
+from coalesce import SingleFlight
+from precompute import read_artifact, read_derived
+
+# 사전 계산 CLI (python dashboard.py precompute --workbook ...) 는 Streamlit 화면 없이 실행하고 종료
+if __name__ == "__main__" and sys.argv[1:2] == ['precompute']:
+    import precompute
+    # spawn 작업 프로세스가 이 파일(Streamlit 화면)을 다시 실행하지 않도록 precompute 를 메인 모듈로 지정
+    sys.modules['__main__'] = precompute
+    sys.exit(precompute.main(sys.argv[2:]))
+
+# Copy-on-Write: 공유 데이터셋에서 잘라낸 DataFrame 에 컬럼을 추가/수정해도 원본은 바뀌지 않음
+# (슬라이스와 컬럼 선택은 복사 없이 원본 버퍼를 공유하고, 수정할 때만 복사)
+pd.set_option('mode.copy_on_write', True)
+
 # 페이지 설정
 st.set_page_config(
     page_title="2025 성장지원 워크샵 대시보드",
@@ -68,28 +101,198 @@ st.markdown("""
         font-size: 12px !important;
         background-color: transparent !important;
     }
-    /* 탭 스타일 */
-    .stTabs [data-baseweb="tab-list"] {
+    /* 페이지 내비게이션 스타일 (탭 모양) */
+    .st-key-active_page div[role="radiogroup"] {
         gap: 8px;
     }
-    .stTabs [data-baseweb="tab"] {
+    .st-key-active_page div[role="radiogroup"] > label {
         height: 50px;
-        white-space: pre-wrap;
         background-color: #f0f2f6;
         border-radius: 8px;
         padding-left: 20px;
         padding-right: 20px;
         font-weight: 600;
     }
-    .stTabs [aria-selected="true"] {
+    .st-key-active_page div[role="radiogroup"] > label:has(input:checked) {
         background-color: #ea002c;
         color: white;
     }
 </style>
 """, unsafe_allow_html=True)
 
+logger = logging.getLogger('dashboard')
+
+# 성능 측정 (환경변수 DASHBOARD_DEBUG=1 또는 URL 에 ?debug=1 을 붙이면 켜짐)
+DEBUG_ENV = 'DASHBOARD_DEBUG'
+DEBUG_QUERY_PARAM = 'debug'
+# 실행(rerun)별 측정 구간 기록 (Streamlit 은 실행마다 별도 스레드를 사용)
+_spans = threading.local()
+
+def debug_enabled():
+    """환경변수 또는 URL 쿼리 파라미터로 성능 측정이 켜져 있는지 확인"""
+    flags = ('1', 'true', 'yes', 'on')
+    return (os.environ.get(DEBUG_ENV, '').lower() in flags
+            or st.query_params.get(DEBUG_QUERY_PARAM, '').lower() in flags)
+
+def start_spans(enabled):
+    """이번 실행의 측정 기록을 초기화 (꺼져 있으면 기록하지 않음)"""
+    _spans.records = [] if enabled else None
+    
+    # 측정 로그가 출력되도록 처음 켜질 때 한 번만 핸들러 추가
+    if enabled and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(levelname)s %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+@contextmanager
+def timed(name, **fields):
+    """구간 소요 시간을 기록하는 컨텍스트 매니저
+
+    with 블록 안에서 반환된 dict 에 행 수 등 값을 추가하면 함께 기록됩니다.
+    측정이 꺼져 있으면 시간을 재지 않고 빈 dict 만 넘깁니다.
+    """
+    records = getattr(_spans, 'records', None)
+    if records is None:
+        yield {}
+        return
+    
+    span = {'span': name, **fields}
+    started = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span['ms'] = round((time.perf_counter() - started) * 1000, 2)
+        records.append(span)
+
+def finish_spans(data, page):
+    """이번 실행의 측정 결과를 구조화 로그(JSON)로 남기고 사이드바 패널에 표시"""
+    records = getattr(_spans, 'records', None)
+    _spans.records = None
+    if records is None:
+        return
+    
+    logger.info(json.dumps({
+        'event': 'rerun',
+        'version': data['version'][:12],
+        'page': page,
+        'filters': get_filter_values(),
+        'spans': records,
+        'single_flight': get_single_flight().snapshot(),
+    }, ensure_ascii=False, default=str))
+    
+    with st.sidebar.expander("🛠️ 성능 측정", expanded=True):
+        spans = pd.DataFrame(records)
+        st.metric("측정 구간 합계", f"{spans['ms'].sum():.1f} ms")
+        st.dataframe(spans, use_container_width=True, hide_index=True)
+        st.caption("최초 로드 단계별 시간 (초)")
+        st.json({name: round(seconds, 3) for name, seconds in data['load_timings'].items()})
+        st.caption("동시 계산 합치기 (서버 시작 후 누적 / computed: 직접 계산, coalesced: 다른 세션 결과 사용)")
+        st.json(get_single_flight().snapshot())
+        if st.button("🔬 다음 실행 프로파일링", help="cProfile / tracemalloc 으로 한 번 실행하고 결과를 저장합니다"):
+            st.session_state['profile_next'] = True
+            st.rerun()
+
+# 프로파일링 (URL 에 ?profile=1 을 붙이거나 성능 측정 패널의 버튼으로 다음 실행 한 번만)
+PROFILE_QUERY_PARAM = 'profile'
+# 프로파일 결과 저장 위치 (환경변수로 변경 가능)
+PROFILE_DIR = os.environ.get(
+    'DASHBOARD_PROFILE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dashboard_profiles'),
+)
+# 화면과 리포트에 표시할 상위 항목 수
+PROFILE_TOP_N = 25
+# tracemalloc 은 프로세스 전체에 적용되므로 동시에 한 세션만 프로파일링
+_profile_lock = threading.Lock()
+
+def profile_requested():
+    """이번 실행을 프로파일링할지 확인 (요청은 한 번 쓰면 지워짐)"""
+    requested = st.session_state.pop('profile_next', False)
+    if st.query_params.get(PROFILE_QUERY_PARAM, '').lower() in ('1', 'true', 'yes', 'on'):
+        del st.query_params[PROFILE_QUERY_PARAM]
+        requested = True
+    return requested
+
+def profile_tables(profiler, snapshot, top_n=PROFILE_TOP_N):
+    """누적 시간 상위 함수와 메모리 할당 상위 위치를 DataFrame 두 개로 반환"""
+    stats = pstats.Stats(profiler)
+    functions = pd.DataFrame([
+        {
+            'function': f"{os.path.basename(filename)}:{line}({name})",
+            'calls': calls,
+            'tottime_ms': round(tottime * 1000, 2),
+            'cumtime_ms': round(cumtime * 1000, 2),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items()
+    ]).sort_values('cumtime_ms', ascending=False).head(top_n)
+    
+    allocations = pd.DataFrame([
+        {
+            'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            'size_kib': round(stat.size / 1024, 1),
+            'count': stat.count,
+        }
+        for stat in snapshot.statistics('lineno')[:top_n]
+    ])
+    return functions, allocations
+
+def run_profiled(func):
+    """func 를 cProfile / tracemalloc 아래에서 한 번 실행하고 결과를 저장 / 표시
+
+    PROFILE_DIR 에 pstats 파일(.prof)과 상위 함수 / 할당 위치 리포트(.txt)를 저장합니다.
+    다른 세션이 프로파일링 중이면 일반 실행으로 대체합니다.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        st.toast("다른 세션에서 프로파일링 중이라 일반 모드로 실행합니다.")
+        return func()
+    
+    profiler = cProfile.Profile()
+    try:
+        tracemalloc.start()
+        profiler.enable()
+        try:
+            func()
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    finally:
+        _profile_lock.release()
+    
+    functions, allocations = profile_tables(profiler, snapshot)
+    name = time.strftime('%Y%m%d-%H%M%S')
+    try:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        profiler.dump_stats(os.path.join(PROFILE_DIR, f"{name}.prof"))
+        with open(os.path.join(PROFILE_DIR, f"{name}.txt"), 'w', encoding='utf-8') as f:
+            f.write(f"filters: {get_filter_values()}\n")
+            f.write(f"page: {st.session_state.get('active_page')}\n")
+            f.write(f"peak traced memory: {peak / 1024 / 1024:.1f} MiB\n\n")
+            f.write(functions.to_string(index=False) + "\n\n")
+            f.write(allocations.to_string(index=False) + "\n")
+        saved = os.path.join(PROFILE_DIR, name)
+    except OSError as e:
+        logger.warning("프로파일 결과를 저장하지 못했습니다: %s", e)
+        saved = None
+    
+    with st.expander("🔬 프로파일링 결과", expanded=True):
+        if saved:
+            st.caption(f"저장 위치: {saved}.prof / {saved}.txt · 최대 추적 메모리 {peak / 1024 / 1024:.1f} MiB")
+        st.markdown(f"**누적 시간 상위 {PROFILE_TOP_N}개 함수**")
+        st.dataframe(functions, use_container_width=True, hide_index=True)
+        st.markdown(f"**메모리 할당 상위 {PROFILE_TOP_N}개 위치**")
+        st.dataframe(allocations, use_container_width=True, hide_index=True)
+
+# 공유 데이터셋 (서버 프로세스당 하나, 모든 세션이 같은 객체를 읽음)
+#  - 세션마다 복사본을 만들지 않으므로 페이지 코드는 테이블을 직접 수정하면 안 됩니다.
+#  - 새 컬럼이 필요하면 슬라이스/merge 결과에 추가합니다 (Copy-on-Write 로 원본과 분리됨).
+def freeze_dataset(data):
+    """테이블 dict를 읽기 전용 매핑으로 감쌉니다 (키 추가/교체 불가)"""
+    return MappingProxyType(data)
+
 # 데이터 로드 함수
-@st.cache_data
+@st.cache_resource
 def load_data():
     """엑셀 파일에서 데이터를 로드합니다."""
     try:
@@ -146,35 +349,15 @@ def load_data():
             
             return None
         
-        # 파일 읽기
+        # 파일 읽기 (워크북 내용 해시 기준 디스크 캐시 사용, 변경되면 자동으로 다시 파싱)
         with st.spinner(f'📊 데이터 로드 중... ({os.path.basename(file_path)})'):
-            # 각 시트를 DataFrame으로 읽기
-            program_info = pd.read_excel(file_path, sheet_name='Program_Info')
-            learners = pd.read_excel(file_path, sheet_name='Learners')
-            certification = pd.read_excel(file_path, sheet_name='Certification')
-            budget = pd.read_excel(file_path, sheet_name='Budget')
-            instructors = pd.read_excel(file_path, sheet_name='Instructors')
-            survey = pd.read_excel(file_path, sheet_name='Survey')
-        
-        # 날짜 형식 변환
-        program_info['program_month'] = pd.to_datetime(program_info['program_month'])
-        
-        # 예산 계산 추가
-        budget['actual_budget'] = budget['total_budget']
+            digest = file_digest(file_path)
+            data, load_timings = load_workbook(file_path, digest)
         
-        # 직접비 총액 계산
-        for idx, row in budget.iterrows():
-            prog = program_info[program_info['program_id'] == row['program_id']].iloc[0]
-            budget.loc[idx, 'total_direct_cost'] = row['direct_cost'] * prog['num_learners']
-        
-        return {
-            'program_info': program_info,
-            'learners': learners,
-            'certification': certification,
-            'budget': budget,
-            'instructors': instructors,
-            'survey': survey
-        }
+        data['version'] = digest
+        data['load_timings'] = load_timings
+        data['path'] = file_path
+        return freeze_dataset(data)
         
     except Exception as e:
         st.error(f"⚠️ 데이터 로드 중 오류가 발생했습니다.")
@@ -191,72 +374,524 @@ def load_data():
         
         return None
 
-# 필터 적용 함수
-def apply_filters(data):
-    """필터를 적용하여 데이터를 반환"""
-    filtered_data = data.copy()
+# 업로드 파일 로드 함수 (업로드 내용 해시 기준으로 한 번만 파싱)
+@st.cache_resource(max_entries=8)
+def load_uploaded_data(digest, _file_bytes):
+    """업로드된 엑셀 파일에서 데이터를 로드합니다."""
+    data, load_timings = load_workbook(_file_bytes, digest)
+    data['version'] = digest
+    data['load_timings'] = load_timings
+    return freeze_dataset(data)
+
+def upload_digest(uploaded_file):
+    """업로드 파일의 내용 해시 (업로드마다 한 번만 계산하고 재실행에서는 session_state 값 사용)"""
+    cached = st.session_state.get('upload_digest')
+    if cached is None or cached[0] != uploaded_file.file_id:
+        cached = (uploaded_file.file_id, file_digest(uploaded_file.getvalue()))
+        st.session_state.upload_digest = cached
+    return cached[1]
+
+# 데이터 디렉터리 모드 (환경변수로 디렉터리를 지정하면 안의 워크북을 모두 합쳐서 사용)
+DATA_DIR_ENV = 'DASHBOARD_DATA_DIR'
+
+def directory_signature(directory):
+    """디렉터리 워크북 목록과 수정 시각 / 크기 튜플 (워크북이 추가 / 변경되면 달라짐)"""
+    try:
+        return tuple(
+            (os.path.basename(path), os.stat(path).st_mtime_ns, os.stat(path).st_size)
+            for path in list_workbooks(directory)
+        )
+    except OSError:
+        return None
+
+# 데이터 디렉터리 로드 함수 (워크북 목록이 바뀔 때만 다시 합침, 기존 워크북은 디스크 캐시 사용)
+@st.cache_resource(max_entries=2)
+def load_directory_data(directory, signature):
+    """디렉터리의 모든 워크북을 하나의 데이터셋으로 로드합니다."""
+    try:
+        with st.spinner(f'📊 데이터 로드 중... ({directory}, 워크북 {len(signature or ())}개)'):
+            data, load_timings, digest = load_directory(directory)
+    except Exception as e:
+        st.error(f"⚠️ 데이터 디렉터리를 읽는 중 오류가 발생했습니다: {directory}")
+        st.caption(f"오류 상세: {str(e)}")
+        return None
     
-    # session_state에서 필터 값 가져오기
-    if 'filter_program' in st.session_state and st.session_state.filter_program != '전체':
-        prog_id = filtered_data['program_info'][
-            filtered_data['program_info']['program_name'] == st.session_state.filter_program
-        ]['program_id'].values[0]
+    data['version'] = digest
+    data['load_timings'] = load_timings
+    return freeze_dataset(data)
+
+def load_dataset():
+    """데이터 디렉터리 모드면 디렉터리의 워크북 전체를, 아니면 단일 워크북(변경 감시 포함)을 로드"""
+    directory = os.environ.get(DATA_DIR_ENV)
+    if directory:
+        return load_directory_data(os.path.abspath(directory), directory_signature(directory))
+    return current_data(load_data())
+
+# 워크북 변경 감시 (환경변수 DASHBOARD_WATCH=0 이면 끔)
+WATCH_ENV = 'DASHBOARD_WATCH'
+# 저장 중 연달아 발생하는 파일 이벤트를 모아서 한 번만 다시 로드 (초)
+RELOAD_DEBOUNCE = 1.0
+
+class WorkbookWatcher(FileSystemEventHandler):
+    """워크북 파일이 바뀌면 내용이 바뀐 시트만 백그라운드에서 다시 로드해 스냅샷을 교체
+
+    세션은 실행(rerun)마다 snapshot 을 한 번 읽으므로, 새 스냅샷(인덱스 / 큐브 포함)이
+    준비될 때까지는 이전 스냅샷을 계속 사용하고 준비되면 다음 실행부터 새 스냅샷을 사용합니다.
+    """
+    
+    def __init__(self, path, data):
+        self.path = os.path.abspath(path)
+        self.snapshot = data
+        self.sheets = None
+        self._reload_lock = threading.Lock()
+        self._timer = None
         
-        # 각 데이터프레임 필터링
-        filtered_data['program_info'] = filtered_data['program_info'][
-            filtered_data['program_info']['program_id'] == prog_id
-        ]
-        filtered_data['learners'] = filtered_data['learners'][
-            filtered_data['learners']['program_id'] == prog_id
-        ]
-        filtered_data['budget'] = filtered_data['budget'][
-            filtered_data['budget']['program_id'] == prog_id
-        ]
-        filtered_data['instructors'] = filtered_data['instructors'][
-            filtered_data['instructors']['program_id'] == prog_id
-        ]
-        filtered_data['survey'] = filtered_data['survey'][
-            filtered_data['survey']['program_id'] == prog_id
-        ]
-        filtered_data['certification'] = filtered_data['certification'][
-            filtered_data['certification']['program_id'] == prog_id
-        ]
-    
-    # 회사 필터 적용
-    if 'filter_companies' in st.session_state and len(st.session_state.filter_companies) > 0:
-        filtered_data['learners'] = filtered_data['learners'][
-            filtered_data['learners']['company'].isin(st.session_state.filter_companies)
-        ]
-        filtered_data['survey'] = filtered_data['survey'][
-            filtered_data['survey']['company'].isin(st.session_state.filter_companies)
-        ]
-    
-    # 기간 필터 적용
-    if 'filter_months' in st.session_state and len(st.session_state.filter_months) > 0:
-        filtered_data['program_info'] = filtered_data['program_info'][
-            filtered_data['program_info']['program_month'].dt.strftime('%Y-%m').isin(st.session_state.filter_months)
-        ]
-        # 필터링된 프로그램의 ID만 유지
-        valid_program_ids = filtered_data['program_info']['program_id'].unique()
-        filtered_data['learners'] = filtered_data['learners'][
-            filtered_data['learners']['program_id'].isin(valid_program_ids)
-        ]
-        filtered_data['budget'] = filtered_data['budget'][
-            filtered_data['budget']['program_id'].isin(valid_program_ids)
-        ]
-        filtered_data['instructors'] = filtered_data['instructors'][
-            filtered_data['instructors']['program_id'].isin(valid_program_ids)
-        ]
-        filtered_data['survey'] = filtered_data['survey'][
-            filtered_data['survey']['program_id'].isin(valid_program_ids)
-        ]
-        filtered_data['certification'] = filtered_data['certification'][
-            filtered_data['certification']['program_id'].isin(valid_program_ids)
-        ]
+        # 현재 스냅샷의 시트별 해시 (첫 화면이 늦어지지 않도록 백그라운드에서 계산)
+        threading.Thread(target=self._init_sheets, daemon=True).start()
+        
+        # cache_resource 를 비운 뒤 다시 만든 경우 같은 워크북의 이전 감시 스레드를 정리
+        name = f"workbook-watcher:{self.path}"
+        for thread in threading.enumerate():
+            if isinstance(thread, Observer) and thread.name == name:
+                thread.stop()
+                thread.join(timeout=5)
+        
+        self.observer = Observer()
+        self.observer.name = name
+        self.observer.daemon = True
+        self.observer.schedule(self, os.path.dirname(self.path), recursive=False)
+        self.observer.start()
+    
+    def _init_sheets(self):
+        with self._reload_lock:
+            try:
+                if file_digest(self.path) == self.snapshot['version']:
+                    self.sheets = sheet_digests(self.path)
+            except Exception as e:
+                # 저장 중인 워크북은 zip 을 읽다가 실패할 수 있음 (시트 해시 없이 다음 변경에서 전체를 다시 읽음)
+                logger.warning("워크북 시트 해시를 계산하지 못했습니다: %s", e)
     
+    def on_any_event(self, event):
+        paths = {event.src_path, getattr(event, 'dest_path', '')}
+        if event.is_directory or self.path not in {os.path.abspath(p) for p in paths if p}:
+            return
+        # 마지막 이벤트 후 RELOAD_DEBOUNCE 초가 지나면 다시 로드
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(RELOAD_DEBOUNCE, self.reload)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def reload(self):
+        """바뀐 시트만 다시 파싱 / 인덱싱한 뒤 스냅샷을 교체 (실패하면 이전 스냅샷 유지)"""
+        with self._reload_lock:
+            previous = self.snapshot
+            try:
+                digest = file_digest(self.path)
+                if digest == previous['version']:
+                    return
+                sheets = sheet_digests(self.path)
+                old_sheets = self.sheets or {}
+                changed_sheets = {key for key in SHEETS if sheets.get(key) != old_sheets.get(key)}
+                
+                started = time.perf_counter()
+                data, load_timings, changed = reload_workbook(self.path, previous, changed_sheets, digest)
+                data['version'] = digest
+                data['load_timings'] = load_timings
+                data['path'] = self.path
+                
+                # 바뀌지 않은 테이블의 인덱스 / 큐브는 이전 버전 것을 재사용해 미리 생성
+                reuse = {'version': previous['version'], 'data': previous, 'unchanged': set(SHEETS) - changed}
+                build_filter_index(digest, data, _reuse=reuse)
+                build_cube(digest, data, _reuse=reuse)
+                build_token_index(digest, data, _reuse=reuse)
+                build_program_bundles(digest, data)
+            except Exception as e:
+                # 저장 중인 파일(zip 손상, 읽다 만 시트) 등은 다음 이벤트에서 다시 시도
+                logger.warning("워크북을 다시 로드하지 못해 이전 데이터를 유지합니다: %s", e)
+                return
+            
+            self.snapshot = freeze_dataset(data)
+            self.sheets = sheets
+            logger.info("워크북 변경 반영 (%.2fs): %s", time.perf_counter() - started,
+                        ', '.join(sorted(changed)) or '변경된 시트 없음')
+
+@st.cache_resource
+def get_workbook_watcher(path, _data):
+    """워크북 경로별 감시자 (서버 프로세스당 하나)"""
+    return WorkbookWatcher(path, _data)
+
+def current_data(data):
+    """감시 중인 워크북이면 가장 최근 스냅샷을, 아니면 data 를 그대로 반환"""
+    if data is None or 'path' not in data or os.environ.get(WATCH_ENV, '1').lower() in ('0', 'false', 'no', 'off'):
+        return data
+    return get_workbook_watcher(data['path'], data).snapshot
+
+# 사전 계산 아티팩트 (python dashboard.py precompute 로 생성, 데이터 버전별로 시작 시 한 번 읽음)
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_precomputed(version):
+    """데이터 버전의 사전 계산 인덱스 / 큐브 / 키워드 인덱스 / 프로그램 번들 (없으면 None)"""
+    derived = read_derived(version)
+    if derived is not None:
+        logger.info("사전 계산 아티팩트 사용: %s", version[:12])
+    return derived
+
+# 필터 인덱스 생성 함수 (데이터 버전별로 한 번만 생성)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_filter_index(version, _data, _reuse=None):
+    """analytics.filter_index 결과를 데이터 버전별로 캐시 (사전 계산 아티팩트가 있으면 사용)
+
+    _reuse 를 주면 바뀌지 않은 테이블의 행 위치는 이전 버전의 인덱스를 그대로 사용합니다.
+    """
+    if not _reuse:
+        derived = get_precomputed(version)
+        return filter_index(_data) if derived is None else derived['index']
+    return filter_index(_data, build_filter_index(_reuse['version'], _reuse['data']), _reuse['unchanged'])
+
+# 집계 큐브 생성 함수 (데이터 버전별로 한 번만 생성)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_cube(version, _data, _reuse=None):
+    """analytics.aggregate_cube 결과를 데이터 버전별로 캐시 (사전 계산 아티팩트가 있으면 사용)
+
+    _reuse 를 주면 원본 테이블이 바뀌지 않은 큐브 테이블은 이전 버전의 것을 그대로 사용합니다.
+    """
+    if not _reuse:
+        derived = get_precomputed(version)
+        return aggregate_cube(_data) if derived is None else derived['cube']
+    return aggregate_cube(_data, build_cube(_reuse['version'], _reuse['data']), _reuse['unchanged'])
+
+# 프로그램별 상세 번들 생성 함수 (데이터 버전별로 한 번만 생성)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_program_bundles(version, _data):
+    """analytics.program_bundles 결과를 데이터 버전별로 캐시 (사전 계산 아티팩트가 있으면 사용)"""
+    derived = get_precomputed(version)
+    if derived is not None:
+        return derived['programs']
+    return program_bundles(_data, build_filter_index(version, _data))
+
+# 토큰화 결과를 기억할 코멘트 수
+TOKEN_MEMO_SIZE = 500000
+
+# 코멘트 토큰화 결과 (서버 전체에서 공유, 데이터가 바뀌어도 새 코멘트만 토큰화)
+@st.cache_resource(show_spinner=False)
+def get_token_memo():
+    """코멘트 원문 -> 키워드 목록 LRU 캐시와 잠금 객체"""
+    return LRUCache(maxsize=TOKEN_MEMO_SIZE), threading.Lock()
+
+# 키워드 인덱스 생성 함수 (데이터 버전별로 한 번만 생성)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_token_index(version, _data, _reuse=None):
+    """analytics.token_index 결과를 데이터 버전별로 캐시 (사전 계산 아티팩트가 있으면 사용)
+
+    _reuse 를 주고 설문 테이블이 바뀌지 않았으면 이전 버전의 인덱스를 그대로 사용합니다.
+    """
+    if _reuse and 'survey' in _reuse['unchanged']:
+        return build_token_index(_reuse['version'], _reuse['data'])
+    derived = get_precomputed(version) if not _reuse else None
+    if derived is not None:
+        return derived['tokens']
+    memo, lock = get_token_memo()
+    return token_index(_data, memo, lock)
+
+# 진행 중인 계산 목록 (서버의 모든 세션이 공유)
+@st.cache_resource(show_spinner=False)
+def get_single_flight():
+    """필터 결과 / 페이지 결과 계산을 합치는 SingleFlight"""
+    return SingleFlight()
+
+# 필터 결과 캐시 크기 (필터 조합 수)
+FILTER_CACHE_SIZE = 64
+
+# 필터 결과 캐시 (서버의 모든 세션이 공유)
+@st.cache_resource(show_spinner=False)
+def get_filter_cache():
+    """필터 조합별 필터링 결과를 보관하는 LRU 캐시와 잠금 객체"""
+    return LRUCache(maxsize=FILTER_CACHE_SIZE), threading.Lock()
+
+def get_filter_values():
+    """session_state의 필터 값을 정규화된 튜플로 반환 (캐시 키로 사용)"""
+    return Filters(
+        st.session_state.get('filter_program', '전체'),
+        tuple(sorted(set(st.session_state.get('filter_companies', [])))),
+        tuple(sorted(set(st.session_state.get('filter_months', [])))),
+    )
+
+# 필터 적용 함수
+def apply_filters(data):
+    """session_state 의 필터를 적용하여 데이터를 반환 (같은 데이터 버전과 필터 조합은 캐시된 결과 사용)"""
+    # 호출한 쪽에서 키를 추가해도 캐시된 결과가 바뀌지 않도록 얕은 복사본 반환
+    return dict(cached_filter(data, get_filter_values()))
+
+def cached_filter(data, filters):
+    """필터 조합(Filters)의 필터링 결과를 필터 결과 캐시에서 찾거나 계산 (반환값은 공유되므로 수정하면 안 됨)"""
+    cache, lock = get_filter_cache()
+    key = (data['version'],) + tuple(filters)
+    
+    def compute():
+        # 먼저 끝난 같은 계산이 그 사이 캐시에 넣었으면 그대로 사용
+        with lock:
+            filtered_data = cache.get(key)
+        if filtered_data is None:
+            filtered_data = filter_data(data, *filters)
+            with lock:
+                cache[key] = filtered_data
+        return filtered_data
+    
+    with lock:
+        filtered_data = cache.get(key)
+    if filtered_data is None:
+        # 다른 세션이 같은 조합을 계산 중이면 그 결과를 기다림
+        filtered_data, _ = get_single_flight().do(('filter',) + key, compute)
     return filtered_data
 
+def filter_data(data, filter_program, filter_companies, filter_months):
+    """캐시된 인덱스 / 큐브 / 키워드 인덱스 / 번들로 analytics.filter_dataset 실행"""
+    version = data['version']
+    derived = {
+        'index': build_filter_index(version, data),
+        'cube': build_cube(version, data),
+        'tokens': build_token_index(version, data),
+        'programs': build_program_bundles(version, data),
+    }
+    return filter_dataset(data, Filters(filter_program, filter_companies, filter_months), derived)
+
+# 페이지 계산 결과 캐시 크기 (페이지 x 필터 조합 수)
+PAGE_CACHE_SIZE = 256
+
+# 페이지 계산 결과 캐시 (서버의 모든 세션이 공유)
+@st.cache_resource(show_spinner=False)
+def get_page_cache():
+    """페이지별 집계 결과를 보관하는 LRU 캐시와 잠금 객체"""
+    return LRUCache(maxsize=PAGE_CACHE_SIZE), threading.Lock()
+
+def page_result(data, name, compute):
+    """데이터 버전과 필터 조합별로 페이지 집계 결과를 캐시
+
+    다른 페이지로 이동했다가 돌아오거나 다른 세션이 같은 필터를 쓰면 다시 계산하지 않고,
+    다른 세션이 같은 결과를 계산하는 중이면 그 결과를 기다립니다.
+    사전 계산 아티팩트에 같은 결과가 있으면 계산하지 않고 읽어서 사용합니다.
+    compute 는 filtered data 를 받는 analytics 함수이며, 반환값은 공유되므로 호출한 쪽에서 수정하면 안 됩니다.
+    """
+    cache, lock = get_page_cache()
+    key = (data['version'],) + data['filters'] + (name,)
+    
+    def load():
+        with lock:
+            result = cache.get(key)
+        if result is None:
+            with timed(f"artifact:{name}") as span:
+                result = read_artifact(data['version'], data['filters'], name)
+                if span:
+                    span['hit'] = result is not None
+        if result is None:
+            with timed(f"compute:{name}"):
+                result = compute(data)
+        with lock:
+            cache[key] = result
+        return result
+    
+    with lock:
+        result = cache.get(key)
+    if result is None:
+        with timed(f"result:{name}") as span:
+            result, coalesced = get_single_flight().do(('page',) + key, load)
+            if span:
+                span['coalesced'] = coalesced
+    return result
+
+# 자주 쓰는 필터 조합 미리 계산 (환경변수 DASHBOARD_WARMUP=0 이면 끔)
+WARMUP_ENV = 'DASHBOARD_WARMUP'
+# 동시에 미리 계산하는 필터 조합 수 (화면 요청과 CPU 를 나눠 쓰도록 작게 유지)
+WARMUP_WORKERS = 2
+# 화면 실행(rerun) 중이면 미리 계산을 멈추고 이 간격(초)으로 다시 확인
+WARMUP_PAUSE = 0.2
+# 미리 계산할 최대 필터 조합 수 / 페이지 결과 수 (캐시의 3/4 까지만 채워 실제 요청 결과를 밀어내지 않음)
+WARMUP_MAX_VIEWS = FILTER_CACHE_SIZE * 3 // 4
+WARMUP_MAX_PAGES = PAGE_CACHE_SIZE * 3 // 4
+
+def warmup_views(data):
+    """미리 계산할 필터 조합 목록 ('전체' -> 프로그램별 -> 월별 순서)"""
+    index = build_filter_index(data['version'], data)
+    programs = dict.fromkeys(data['program_info']['program_name'].dropna().tolist())
+    return ([Filters()]
+            + [Filters(program=name) for name in programs]
+            + [Filters(months=(month,)) for month in index['month_programs']])
+
+def landing_pages(filtered):
+    """필터 조합을 선택했을 때 각 페이지의 첫 화면이 쓰는 결과 이름 -> 계산 함수"""
+    computes = page_results(filtered)
+    program = filtered['filters'].program
+    if program == '전체' and len(filtered['program_info']) > 0:
+        # 프로그램 필터가 없으면 상세 페이지는 목록의 첫 프로그램을 표시
+        program = filtered['program_info']['program_name'].iloc[0]
+    names = ['overview', 'learners', 'budget', 'satisfaction:전체', f"program:{program}"]
+    return {name: computes[name] for name in names if name in computes}
+
+class WarmupScheduler:
+    """데이터를 로드하면 '전체' / 프로그램별 / 월별 필터 결과와 첫 화면 페이지 결과를 백그라운드에서 미리 계산
+
+    작업 스레드는 WARMUP_WORKERS 개이고, 화면 실행 중에는 기다렸다가 실행이 없을 때만 계산합니다.
+    다른 데이터 버전으로 다시 schedule 하면 이전 버전의 남은 작업은 버립니다.
+    """
+    
+    def __init__(self, workers=WARMUP_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='warmup')
+        self._lock = threading.Lock()
+        self._foreground = 0
+        self.run = None
+    
+    @contextmanager
+    def foreground(self):
+        """화면 실행 구간 (이 안에 있는 동안 미리 계산은 대기)"""
+        with self._lock:
+            self._foreground += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._foreground -= 1
+    
+    def schedule(self, data):
+        """data 버전의 미리 계산을 시작 (같은 버전이면 아무것도 하지 않음)"""
+        with self._lock:
+            if self.run is not None and self.run['version'] == data['version']:
+                return
+            if self.run is not None:
+                self.run['stop'].set()
+            run = self.run = {'version': data['version'], 'stop': threading.Event(), 'views': 0, 'pages': 0,
+                              'pending': 0, 'started': time.perf_counter()}
+        
+        try:
+            views = warmup_views(data)[:WARMUP_MAX_VIEWS]
+        except Exception as e:
+            logger.warning("미리 계산할 필터 조합을 만들지 못했습니다: %s", e)
+            return
+        run['pending'] = len(views)
+        for filters in views:
+            self._pool.submit(self._warm, run, data, filters)
+    
+    def _wait(self, run):
+        """화면 실행이 없을 때까지 대기 (그 사이 중단되면 False)"""
+        while self._foreground > 0 and not run['stop'].is_set():
+            run['stop'].wait(WARMUP_PAUSE)
+        return not run['stop'].is_set()
+    
+    def _warm(self, run, data, filters):
+        try:
+            if not self._wait(run):
+                return
+            filtered = cached_filter(data, filters)
+            for name, compute in landing_pages(filtered).items():
+                with self._lock:
+                    if run['pages'] >= WARMUP_MAX_PAGES:
+                        return
+                    run['pages'] += 1
+                if not self._wait(run):
+                    return
+                page_result(filtered, name, compute)
+            with self._lock:
+                run['views'] += 1
+        except Exception as e:
+            logger.warning("필터 조합 %s 미리 계산 실패: %s", tuple(filters), e)
+        finally:
+            with self._lock:
+                run['pending'] -= 1
+                done = run['pending'] == 0 and not run['stop'].is_set()
+            if done:
+                logger.info("캐시 미리 계산 완료: 필터 조합 %d개, 페이지 결과 %d개 (%.2fs)", run['views'],
+                            run['pages'], time.perf_counter() - run['started'])
+
+# 미리 계산 스케줄러 (서버 프로세스당 하나)
+@st.cache_resource
+def get_warmup_scheduler():
+    """필터 결과 / 페이지 결과 미리 계산 스케줄러"""
+    return WarmupScheduler()
+
+def warmup_enabled():
+    return os.environ.get(WARMUP_ENV, '1').lower() not in ('0', 'false', 'no', 'off')
+
+# 차트 한 개에 보낼 수 있는 최대 데이터 포인트 수 (넘으면 균등 간격으로 줄여서 전송)
+CHART_POINT_LIMIT = 5000
+# 포인트 수를 줄일 때 함께 잘라야 하는 trace 속성 (포인트마다 값이 하나씩 있는 배열)
+POINT_ATTRIBUTES = ['x', 'y', 'r', 'theta', 'text', 'customdata', 'hovertext', 'ids', 'labels', 'values']
+
+def chart_points(fig):
+    """figure 의 trace 별 포인트 수 리스트 (히트맵은 셀 수)"""
+    points = []
+    for trace in fig.data:
+        z = getattr(trace, 'z', None)
+        if z is not None:
+            points.append(int(np.size(z)))
+        else:
+            points.append(max((len(getattr(trace, name)) for name in POINT_ATTRIBUTES
+                               if getattr(trace, name, None) is not None), default=0))
+    return points
+
+def downsample_figure(fig, limit=CHART_POINT_LIMIT):
+    """전체 포인트 수가 limit 을 넘으면 trace 별로 균등 간격 샘플만 남김 (줄인 trace 가 있으면 True)
+
+    히트맵은 행 / 열을 건너뛰지 않고 합계가 큰 행 / 열만 남긴 뒤 나머지를 '기타' 로 합칩니다
+    (대시보드의 히트맵은 값이 수강생 수).
+    """
+    points = chart_points(fig)
+    total = sum(points)
+    if total <= limit:
+        return False
+    
+    thinned = False
+    for trace, n in zip(fig.data, points):
+        keep = max(1, n * limit // total)
+        if n <= keep:
+            continue
+        z = getattr(trace, 'z', None)
+        if z is not None:
+            if np.ndim(z) != 2:
+                continue
+            matrix = pd.DataFrame(np.asarray(z), index=trace.y, columns=trace.x)
+            capped = cap_matrix(matrix, keep)
+            trace.update(z=capped.to_numpy(), x=list(capped.columns), y=list(capped.index))
+            thinned = True
+            continue
+        thinned = True
+        positions = np.linspace(0, n - 1, keep).round().astype(int)
+        for name in POINT_ATTRIBUTES + ['marker.color']:
+            try:
+                values = trace[name]
+            except (KeyError, ValueError):
+                continue
+            if values is not None and not isinstance(values, str) and np.ndim(values) == 1 and len(values) == n:
+                trace[name] = np.asarray(values)[positions]
+    return thinned
+
+def show_chart(fig):
+    """차트 출력 (포인트 수 상한을 넘으면 줄여서 전송하고 안내 문구 표시)"""
+    with timed('chart', title=fig.layout.title.text) as span:
+        if downsample_figure(fig):
+            st.caption(f"ℹ️ 데이터가 많아 {CHART_POINT_LIMIT:,}개 포인트로 줄여서 표시합니다.")
+        if span:
+            span['points'] = sum(chart_points(fig))
+            span['bytes'] = len(fig.to_json())
+        st.plotly_chart(fig, use_container_width=True)
+
 # 사이드바 필터 설정
+def drop_stale_filters(programs, companies, months):
+    """선택 항목에 없는 필터 값을 정리 (워크북 교체로 프로그램 / 회사 / 월이 바뀐 경우)"""
+    if st.session_state.get('filter_program', '전체') not in programs:
+        st.session_state.filter_program = '전체'
+    for name, options in (('companies', companies), ('months', months)):
+        values = st.session_state.get(f'filter_{name}', [])
+        if any(value not in options for value in values):
+            st.session_state[f'filter_{name}'] = [value for value in values if value in options]
+    
+    # 위젯 상태에 남은 이전 값은 지우고 정리한 필터 값으로 다시 생성
+    for key, options in (('temp_program', programs), ('temp_companies', companies), ('temp_months', months)):
+        if key not in st.session_state:
+            continue
+        value = st.session_state[key]
+        values = value if isinstance(value, list) else [value]
+        if any(item not in options for item in values):
+            del st.session_state[key]
+
 def setup_sidebar_filters(data):
     """사이드바 필터 설정"""
     st.sidebar.title("🔍 필터 옵션")
@@ -270,8 +905,13 @@ def setup_sidebar_filters(data):
     
     st.sidebar.markdown("---")
     
-    # 프로그램 필터
+    # 선택 항목 (워크북이 교체되면 바뀔 수 있음)
     programs = ['전체'] + data['program_info']['program_name'].tolist()
+    companies = data['learners']['company'].dropna().unique().tolist()
+    months = list(build_filter_index(data['version'], data)['month_programs'])
+    drop_stale_filters(programs, companies, months)
+    
+    # 프로그램 필터
     selected_program = st.sidebar.selectbox(
         "프로그램 선택", 
         programs,
@@ -280,7 +920,6 @@ def setup_sidebar_filters(data):
     )
     
     # 회사 필터
-    companies = data['learners']['company'].dropna().unique().tolist()
     selected_companies = st.sidebar.multiselect(
         "회사 선택", 
         companies,
@@ -289,7 +928,6 @@ def setup_sidebar_filters(data):
     )
     
     # 기간 필터
-    months = data['program_info']['program_month'].dt.strftime('%Y-%m').unique()
     selected_months = st.sidebar.multiselect(
         "월 선택", 
         months,
@@ -327,26 +965,22 @@ def show_overview(data):
         st.warning("선택한 필터에 해당하는 데이터가 없습니다.")
         return
     
-    # KPI 계산
-    total_programs = len(data['program_info'])
-    total_learners = data['learners'].shape[0]
-    total_budget = data['budget']['actual_budget'].sum() / 1000000 if len(data['budget']) > 0 else 0
-    total_direct_cost = data['budget']['total_direct_cost'].sum() / 1000000 if len(data['budget']) > 0 else 0
-    avg_satisfaction = data['survey'][data['survey']['rating'].notna()]['rating'].mean() if len(data['survey']) > 0 else 0
+    result = page_result(data, 'overview', overview_metrics)
+    kpis = result['kpis']
     
     # KPI 카드 표시
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("총 프로그램 수", f"{total_programs}개", "")
+        st.metric("총 프로그램 수", f"{kpis['programs']}개", "")
     with col2:
-        st.metric("총 수강생 수", f"{total_learners}명", "")
+        st.metric("총 수강생 수", f"{kpis['learners']}명", "")
     with col3:
-        st.metric("총 예산", f"{total_budget:.1f}백만원", "")
+        st.metric("총 예산", f"{kpis['budget']:.1f}백만원", "")
     with col4:
-        st.metric("총 직접비", f"{total_direct_cost:.1f}백만원", "")
+        st.metric("총 직접비", f"{kpis['direct_cost']:.1f}백만원", "")
     with col5:
-        st.metric("평균 만족도", f"{avg_satisfaction:.2f}/5.0", "")
+        st.metric("평균 만족도", f"{kpis['satisfaction']:.2f}/5.0", "")
     
     st.markdown("---")
     
@@ -354,63 +988,25 @@ def show_overview(data):
     col1, col2 = st.columns(2)
     
     with col1:
-        # 월별 교육 운영 현황 (수정: 1-12월 고정, 월 단위만 표시)
-        # 1-12월 데이터 프레임 생성
-        months_df = pd.DataFrame({'month': range(1, 13)})
-        months_df['month_str'] = months_df['month'].apply(lambda x: f"{x}월")
-        
-        # 실제 데이터 집계
-        program_monthly = data['program_info'].copy()
-        program_monthly['month'] = program_monthly['program_month'].dt.month
-        monthly_count = program_monthly.groupby('month').size().reset_index(name='프로그램 수')
-        
-        # 1-12월과 실제 데이터 병합
-        months_df = months_df.merge(monthly_count, on='month', how='left')
-        months_df['프로그램 수'] = months_df['프로그램 수'].fillna(0)
-        
-        fig1 = px.bar(months_df, x='month_str', y='프로그램 수',
+        # 월별 교육 운영 현황 (1-12월 고정, 월 단위만 표시)
+        fig1 = px.bar(result['monthly'], x='month_str', y='프로그램 수',
                      title="월별 교육 프로그램 운영 현황",
                      color_discrete_sequence=['#ea002c'])
         fig1.update_layout(height=400, xaxis_title="",
-                          xaxis={'categoryorder': 'array', 
-                                 'categoryarray': ['1월','2월','3월','4월','5월','6월','7월','8월','9월','10월','11월','12월']})
-        st.plotly_chart(fig1, use_container_width=True)
+                          xaxis={'categoryorder': 'array', 'categoryarray': MONTH_LABELS})
+        show_chart(fig1)
     
     with col2:
-        # 직무분야별 프로그램 수 (수정: 11개 직무 고정, 프로그램 수로 변경)
-        job_categories = ['전략', '사업개발', '재무', 'HR', '마케팅', 'Sales', '법무', 'IP', '구매/SCM', 'SVESG', '일하는 방식']
-        
-        # 실제 데이터에서 직무별 프로그램 수 계산
-        job_programs = data['program_info'].groupby('job_category').size().reset_index(name='프로그램 수')
-        
-        # 11개 카테고리 데이터프레임 생성
-        job_df = pd.DataFrame({'job_category': job_categories})
-        job_df = job_df.merge(job_programs, on='job_category', how='left')
-        job_df['프로그램 수'] = job_df['프로그램 수'].fillna(0)
-        
-        fig2 = px.bar(job_df, x='job_category', y='프로그램 수',
+        # 직무분야별 프로그램 수 (11개 직무 고정)
+        fig2 = px.bar(result['jobs'], x='job_category', y='프로그램 수',
                      title="직무분야별 프로그램 수",
                      color_discrete_sequence=['#ff5800'])
         fig2.update_layout(height=400, xaxis_title="직무분야")
-        st.plotly_chart(fig2, use_container_width=True)
+        show_chart(fig2)
     
     # 프로그램 요약 테이블
     st.markdown("### 📋 프로그램 요약")
-    program_summary = data['program_info'].merge(data['budget'], on='program_id')
-    
-    # 만족도 계산
-    satisfaction_by_program = data['survey'].groupby('program_id')['rating'].mean().reset_index()
-    satisfaction_by_program.columns = ['program_id', 'avg_satisfaction']
-    program_summary = program_summary.merge(satisfaction_by_program, on='program_id', how='left')
-    
-    summary_display = program_summary[['program_name', 'job_category', 'num_learners', 
-                                       'actual_budget', 'total_direct_cost', 'avg_satisfaction']].copy()
-    summary_display['actual_budget'] = (summary_display['actual_budget'] / 1000000).round(1)
-    summary_display['total_direct_cost'] = (summary_display['total_direct_cost'] / 1000000).round(1)
-    summary_display['avg_satisfaction'] = summary_display['avg_satisfaction'].round(2)
-    
-    summary_display.columns = ['프로그램명', '직무분야', '수강생수', '예산(백만원)', '직접비(백만원)', '만족도']
-    st.dataframe(summary_display, use_container_width=True, hide_index=True)
+    st.dataframe(result['summary'], use_container_width=True, hide_index=True)
 
 # 프로그램별 상세 페이지
 def show_program_details(data, selected_program):
@@ -431,20 +1027,18 @@ def show_program_details(data, selected_program):
         # 필터링된 프로그램 목록에서 선택
         selected_prog_name = st.selectbox("분석할 프로그램 선택", programs)
     
-    # 선택된 프로그램 정보 가져오기
-    prog_info = data['program_info'][data['program_info']['program_name'] == selected_prog_name]
-    if len(prog_info) == 0:
+    # 선택된 프로그램의 미리 계산된 상세 번들 (회사 필터 적용)
+    detail = page_result(data, f"program:{selected_prog_name}",
+                         lambda data: program_detail(data, selected_prog_name))
+    if detail is None:
         st.warning("선택한 프로그램의 정보를 찾을 수 없습니다.")
         return
     
-    prog_info = prog_info.iloc[0]
-    prog_id = prog_info['program_id']
-    
-    prog_budget_df = data['budget'][data['budget']['program_id'] == prog_id]
-    if len(prog_budget_df) == 0:
+    prog_info = detail['info']
+    prog_budget = detail['budget']
+    if prog_budget is None:
         st.warning("선택한 프로그램의 예산 정보를 찾을 수 없습니다.")
         return
-    prog_budget = prog_budget_df.iloc[0]
     
     # 프로그램 정보 카드
     st.markdown(f"#### 📌 {selected_prog_name}")
@@ -465,14 +1059,13 @@ def show_program_details(data, selected_program):
     col1, col2 = st.columns(2)
     
     with col1:
-        # 수강생 회사별 분포
-        prog_learners = data['learners'][data['learners']['program_id'] == prog_id]
-        company_dist = prog_learners['company'].value_counts().head(10)
+        # 수강생 회사별 분포 (회사 필터가 있으면 해당 회사만)
+        company_dist = detail['company_dist']
         fig1 = px.bar(x=company_dist.values, y=company_dist.index, orientation='h',
                      title="회사별 수강생 분포",
                      labels={'x': '수강생 수', 'y': '회사'},
                      color_discrete_sequence=['#ff5800'])
-        st.plotly_chart(fig1, use_container_width=True)
+        show_chart(fig1)
     
     with col2:
         # 예산 vs 직접비 비교
@@ -486,19 +1079,15 @@ def show_program_details(data, selected_program):
         fig2.update_layout(title="예산 vs 직접비 비교 (백만원)",
                           barmode='group',
                           yaxis_title="금액 (백만원)")
-        st.plotly_chart(fig2, use_container_width=True)
+        show_chart(fig2)
     
     # 강사 정보
     st.markdown("#### 👨‍🏫 강사진 정보")
-    prog_instructors = data['instructors'][data['instructors']['program_id'] == prog_id]
-    inst_display = prog_instructors[['instructor_name', 'lecture_hours', 'lecture_fee']].copy()
-    inst_display['lecture_fee'] = (inst_display['lecture_fee'] / 1000000).round(1)
-    inst_display.columns = ['강사명', '강의시간', '강사료(백만원)']
-    st.dataframe(inst_display, use_container_width=True, hide_index=True)
+    st.dataframe(detail['instructors'], use_container_width=True, hide_index=True)
     
     # 자격증 정보 (있는 경우)
-    if prog_id in data['certification']['program_id'].values:
-        cert_info = data['certification'][data['certification']['program_id'] == prog_id].iloc[0]
+    cert_info = detail['certification']
+    if cert_info is not None:
         st.markdown("#### 🏆 자격증 취득 현황")
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -506,19 +1095,20 @@ def show_program_details(data, selected_program):
         with col2:
             st.metric("응시자", f"{cert_info['exam_candidates']}명")
         with col3:
-            pass_rate = (cert_info['exam_passed'] / cert_info['exam_candidates'] * 100)
-            st.metric("합격률", f"{pass_rate:.1f}%")
+            st.metric("합격률", f"{detail['pass_rate']:.1f}%")
 
 # 수강생 분석 페이지
 def show_learner_analysis(data):
     """수강생 분석"""
     st.markdown("### 👥 수강생 분석")
     
+    result = page_result(data, 'learners', learner_summary)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # 회사별 수강생 현황 (Top 10)
-        company_counts = data['learners']['company'].value_counts().head(10)
+        company_counts = result['companies']
         fig1 = px.bar(x=company_counts.values, y=company_counts.index,
                      orientation='h',
                      title="회사별 수강생 현황 (Top 10)",
@@ -526,107 +1116,93 @@ def show_learner_analysis(data):
                      color=company_counts.values,
                      color_continuous_scale=['#ffa500', '#ff5800', '#ea002c'])
         fig1.update_layout(height=400)
-        st.plotly_chart(fig1, use_container_width=True)
+        show_chart(fig1)
     
     with col2:
         # 직급별 분포
-        level_counts = data['learners']['job_level'].value_counts()
+        level_counts = result['levels']
         fig2 = px.pie(values=level_counts.values, names=level_counts.index,
                      title="직급별 분포",
                      color_discrete_sequence=['#ea002c', '#ff5800', '#ffa500'])
         fig2.update_layout(height=400)
-        st.plotly_chart(fig2, use_container_width=True)
+        show_chart(fig2)
     
     # 프로그램별 x 회사별 히트맵
     st.markdown("#### 🔥 프로그램별 x 회사별 수강생 분포")
     
-    # 데이터 준비
-    learner_program = data['learners'].merge(data['program_info'][['program_id', 'program_name']], on='program_id')
-    heatmap_data = learner_program.groupby(['program_name', 'company']).size().reset_index(name='count')
-    heatmap_pivot = heatmap_data.pivot(index='company', columns='program_name', values='count').fillna(0)
-    
-    fig3 = px.imshow(heatmap_pivot,
+    fig3 = px.imshow(result['heatmap'],
                     labels=dict(x="프로그램", y="회사", color="수강생 수"),
                     color_continuous_scale=['white', '#ffa500', '#ea002c'],
                     aspect="auto")
     fig3.update_layout(height=500)
-    st.plotly_chart(fig3, use_container_width=True)
+    show_chart(fig3)
     
     # 수강생 상세 리스트
     st.markdown("#### 📋 수강생 상세 리스트")
     
+    browser = result['browser']
+    options = result['options']
+    
     # 필터링 옵션
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        filter_company = st.selectbox("회사 필터", ['전체'] + data['learners']['company'].dropna().unique().tolist())
+        filter_company = st.selectbox("회사 필터", ['전체'] + options['company'])
     with col2:
-        filter_program = st.selectbox("프로그램 필터", ['전체'] + data['program_info']['program_name'].unique().tolist())
+        filter_program = st.selectbox("프로그램 필터", ['전체'] + options['program_name'])
     with col3:
-        filter_level = st.selectbox("직급 필터", ['전체'] + data['learners']['job_level'].dropna().unique().tolist())
-    
-    # 필터링 적용
-    filtered_learners = data['learners'].merge(data['program_info'][['program_id', 'program_name']], on='program_id')
+        filter_level = st.selectbox("직급 필터", ['전체'] + options['job_level'])
+    with col4:
+        query = st.text_input("수강생ID / 부서 검색", placeholder="앞부분 일치 (예: L00)")
     
-    if filter_company != '전체':
-        filtered_learners = filtered_learners[filtered_learners['company'] == filter_company]
-    if filter_program != '전체':
-        filtered_learners = filtered_learners[filtered_learners['program_name'] == filter_program]
-    if filter_level != '전체':
-        filtered_learners = filtered_learners[filtered_learners['job_level'] == filter_level]
+    conditions = {'company': filter_company, 'program_name': filter_program, 'job_level': filter_level}
+    positions = search_learners(browser, conditions, query)
+    total = len(browser['table']) if positions is None else len(positions)
+    pages = max(1, -(-total // LEARNER_PAGE_SIZE))
     
-    display_cols = ['learner_id', 'program_name', 'company', 'dept', 'job_level']
-    display_df = filtered_learners[display_cols].copy()
-    display_df.columns = ['수강생ID', '프로그램', '회사', '부서', '직급']
+    # 선택한 페이지의 행만 전송
+    page = st.number_input(f"페이지 (총 {pages:,}페이지)", min_value=1, max_value=pages, value=1, step=1)
+    display_df = learner_page(browser, positions, page)
     
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
-    st.info(f"총 {len(display_df)}명의 수강생이 검색되었습니다.")
+    st.dataframe(display_df.rename(columns=LEARNER_COLUMNS), use_container_width=True, hide_index=True)
+    st.info(f"총 {total}명의 수강생이 검색되었습니다.")
 
 # 예산 분석 페이지 (수정됨: KPI 카드 수정)
 def show_budget_analysis(data):
     """예산 분석"""
     st.markdown("### 💰 예산 분석")
     
-    # 상단 요약 카드 (수정: 개발비, 강사료, 예비비, 평균예산 추가)
-    total_budget = data['budget']['actual_budget'].sum() / 1000000
-    total_direct = data['budget']['total_direct_cost'].sum() / 1000000
-    total_dev_cost = data['budget']['dev_cost'].sum() / 1000000
-    total_instructor_fee = data['budget']['instructor_fee'].sum() / 1000000
-    total_reserve_fund = data['budget']['reserve_fund'].sum() / 1000000
-    avg_budget = total_budget / len(data['program_info'])
+    result = page_result(data, 'budget', budget_breakdown)
+    totals = result['totals']
     
     # 첫 번째 줄: 주요 지표
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("총 예산", f"{total_budget:.1f}백만원", "")
+        st.metric("총 예산", f"{totals['budget']:.1f}백만원", "")
     with col2:
-        st.metric("총 직접비", f"{total_direct:.1f}백만원", "")
+        st.metric("총 직접비", f"{totals['direct_cost']:.1f}백만원", "")
     with col3:
-        st.metric("평균 예산", f"{avg_budget:.1f}백만원", "프로그램당")
+        st.metric("평균 예산", f"{totals['avg_budget']:.1f}백만원", "프로그램당")
     with col4:
-        budget_ratio = (total_budget/(total_budget+total_direct)*100)
-        st.metric("예산 비율", f"{budget_ratio:.1f}%", "")
+        st.metric("예산 비율", f"{totals['budget_ratio']:.1f}%", "")
     
     # 두 번째 줄: 예산 세부 항목
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("총 개발비", f"{total_dev_cost:.1f}백만원", 
-                 f"{(total_dev_cost/total_budget*100):.1f}%")
+        st.metric("총 개발비", f"{totals['dev_cost']:.1f}백만원", 
+                 f"{(totals['dev_cost']/totals['budget']*100):.1f}%")
     with col2:
-        st.metric("총 강사료", f"{total_instructor_fee:.1f}백만원",
-                 f"{(total_instructor_fee/total_budget*100):.1f}%")
+        st.metric("총 강사료", f"{totals['instructor_fee']:.1f}백만원",
+                 f"{(totals['instructor_fee']/totals['budget']*100):.1f}%")
     with col3:
-        st.metric("총 예비비", f"{total_reserve_fund:.1f}백만원",
-                 f"{(total_reserve_fund/total_budget*100):.1f}%")
+        st.metric("총 예비비", f"{totals['reserve_fund']:.1f}백만원",
+                 f"{(totals['reserve_fund']/totals['budget']*100):.1f}%")
     
     st.markdown("---")
     
     # 프로그램별 예산 vs 직접비 비교
     st.markdown("#### 📊 프로그램별 예산 vs 직접비 비교")
     
-    # budget_comparison 생성 시 program_id 유지
-    budget_comparison = data['budget'].copy()
-    budget_comparison = budget_comparison.merge(data['program_info'][['program_id', 'program_name']], on='program_id', how='left')
-    
+    budget_comparison = result['comparison']
     fig1 = go.Figure()
     fig1.add_trace(go.Bar(name='예산', x=budget_comparison['program_name'], 
                          y=budget_comparison['actual_budget']/1000000,
@@ -642,7 +1218,7 @@ def show_budget_analysis(data):
                       barmode='group',
                       yaxis_title="금액 (백만원)",
                       height=400)
-    st.plotly_chart(fig1, use_container_width=True)
+    show_chart(fig1)
     
     # 예산 구성 분석
     col1, col2 = st.columns(2)
@@ -650,91 +1226,62 @@ def show_budget_analysis(data):
     with col1:
         st.markdown("#### 💼 예산 항목별 분포")
         
-        fig2 = px.pie(values=[total_dev_cost, total_instructor_fee, total_reserve_fund],
+        fig2 = px.pie(values=[totals['dev_cost'], totals['instructor_fee'], totals['reserve_fund']],
                      names=['개발비', '강사료', '예비비'],
                      color_discrete_sequence=['#ea002c', '#ff5800', '#ffa500'],
                      hole=0.4)
         fig2.update_traces(textposition='inside', textinfo='percent+label')
         fig2.update_layout(height=400)
-        st.plotly_chart(fig2, use_container_width=True)
+        show_chart(fig2)
     
     with col2:
         st.markdown("#### 💵 직접비 효율성 분석")
         
         # 1인당 직접비
-        per_person_cost = data['budget']['direct_cost'].mean() / 1000
-        st.metric("1인당 직접비", f"{per_person_cost:.0f}천원", "")
-        
-        # 프로그램별 직접비 효율성 테이블 - 처음부터 다시 생성
-        efficiency_df = data['budget'].copy()
-        efficiency_df = efficiency_df.merge(data['program_info'][['program_id', 'program_name', 'num_learners']], 
-                                          on='program_id')
-        efficiency_df['직접비_비율'] = (efficiency_df['total_direct_cost'] / 
-                                    (efficiency_df['actual_budget'] + efficiency_df['total_direct_cost']) * 100)
+        st.metric("1인당 직접비", f"{totals['per_person_cost']:.0f}천원", "")
         
-        display_efficiency = efficiency_df[['program_name', 'num_learners', 'direct_cost', 
-                                           'total_direct_cost', '직접비_비율']].copy()
-        display_efficiency['direct_cost'] = (display_efficiency['direct_cost'] / 1000).round(0)
-        display_efficiency['total_direct_cost'] = (display_efficiency['total_direct_cost'] / 1000000).round(1)
-        display_efficiency['직접비_비율'] = display_efficiency['직접비_비율'].round(1)
-        display_efficiency.columns = ['프로그램', '수강생수', '1인당(천원)', '총액(백만원)', '비율(%)']
-        
-        st.dataframe(display_efficiency, use_container_width=True, hide_index=True)
+        # 프로그램별 직접비 효율성 테이블
+        st.dataframe(result['efficiency'], use_container_width=True, hide_index=True)
     
     # 전체 비용 구조
     st.markdown("#### 📈 예산 항목별 분포 상세")
     
     # Stacked bar chart
+    components = result['components']
     fig3 = go.Figure()
-    
-    programs = budget_comparison['program_name'].unique()
-    dev_cost_values = []
-    instructor_fee_values = []
-    reserve_fund_values = []
-    
-    for prog in programs:
-        prog_data = budget_comparison[budget_comparison['program_name'] == prog]
-        dev_cost_values.append(prog_data['dev_cost'].values[0] / 1000000)
-        instructor_fee_values.append(prog_data['instructor_fee'].values[0] / 1000000)
-        reserve_fund_values.append(prog_data['reserve_fund'].values[0] / 1000000)
-    
-    fig3.add_trace(go.Bar(name='개발비', x=programs, y=dev_cost_values,
+    fig3.add_trace(go.Bar(name='개발비', x=components['program_name'], y=components['dev_cost'],
                          marker_color='#ea002c'))
-    fig3.add_trace(go.Bar(name='강사료', x=programs, y=instructor_fee_values,
+    fig3.add_trace(go.Bar(name='강사료', x=components['program_name'], y=components['instructor_fee'],
                          marker_color='#ff5800'))
-    fig3.add_trace(go.Bar(name='예비비', x=programs, y=reserve_fund_values,
+    fig3.add_trace(go.Bar(name='예비비', x=components['program_name'], y=components['reserve_fund'],
                          marker_color='#ffa500'))
     
     fig3.update_layout(barmode='stack',
                       title='프로그램별 예산 항목별 분포 상세 (백만원)',
                       yaxis_title='금액 (백만원)',
                       height=400)
-    st.plotly_chart(fig3, use_container_width=True)
+    show_chart(fig3)
     
     # 강사료 상세 분석
     st.markdown("#### 👨‍🏫 강사료 분석")
-    instructor_analysis = data['instructors'].merge(
-        data['program_info'][['program_id', 'program_name']], on='program_id')
-    
-    # 프로그램별 강사료 총액
-    prog_instructor_fee = instructor_analysis.groupby('program_name')['lecture_fee'].sum().reset_index()
-    prog_instructor_fee['lecture_fee'] = (prog_instructor_fee['lecture_fee'] / 1000000).round(1)
     
     col1, col2 = st.columns(2)
     with col1:
-        fig4 = px.bar(prog_instructor_fee, x='program_name', y='lecture_fee',
+        fig4 = px.bar(result['instructor_fees'], x='program_name', y='lecture_fee',
                      title="프로그램별 강사료 총액 (백만원)",
                      color_discrete_sequence=['#ff5800'])
-        st.plotly_chart(fig4, use_container_width=True)
+        show_chart(fig4)
     
     with col2:
         # 시간당 단가 분석
-        instructor_analysis['hourly_rate'] = instructor_analysis['lecture_fee'] / instructor_analysis['lecture_hours'] / 10000
-        avg_hourly = instructor_analysis.groupby('program_name')['hourly_rate'].mean().reset_index()
-        fig5 = px.bar(avg_hourly, x='program_name', y='hourly_rate',
+        fig5 = px.bar(result['hourly_rates'], x='program_name', y='hourly_rate',
                      title="프로그램별 평균 시간당 강사료 (만원)",
                      color_discrete_sequence=['#ffa500'])
-        st.plotly_chart(fig5, use_container_width=True)
+        show_chart(fig5)
+
+# 키워드 강조 표시 기준 (프로그램별 / 전체 피드백의 최소 언급 횟수)
+KEYWORD_MIN_FREQ = 3
+OVERALL_KEYWORD_MIN_FREQ = 5
 
 # 만족도 분석 페이지 (수정됨: 프로그램별 선택 기능 추가)
 def show_satisfaction_analysis(data):
@@ -749,26 +1296,16 @@ def show_satisfaction_analysis(data):
         key="satisfaction_program_select"
     )
     
-    # 데이터 필터링
-    if selected_prog_for_satisfaction == '전체':
-        satisfaction_data = data['survey'][data['survey']['rating'].notna()]
-        all_survey_data = data['survey']
-        prog_label = "전체"
-    else:
-        prog_id = data['program_info'][data['program_info']['program_name'] == selected_prog_for_satisfaction]['program_id'].values[0]
-        satisfaction_data = data['survey'][(data['survey']['program_id'] == prog_id) & (data['survey']['rating'].notna())]
-        all_survey_data = data['survey'][data['survey']['program_id'] == prog_id]
-        prog_label = selected_prog_for_satisfaction
-    
-    # 전체 만족도 계산
-    overall_satisfaction = satisfaction_data['rating'].mean()
+    result = page_result(data, f"satisfaction:{selected_prog_for_satisfaction}",
+                         lambda data: satisfaction_summary(data, selected_prog_for_satisfaction))
+    overall_satisfaction = result['overall']
     
     # 큰 카드로 만족도 표시
     st.markdown(
         f"""
         <div style='text-align: center; padding: 30px; background: linear-gradient(135deg, #ea002c, #ff5800); 
                     border-radius: 20px; margin: 20px 0;'>
-            <h1 style='color: white; margin: 0;'>{prog_label} 만족도</h1>
+            <h1 style='color: white; margin: 0;'>{result['label']} 만족도</h1>
             <h1 style='color: white; font-size: 60px; margin: 10px 0;'>{overall_satisfaction:.2f} / 5.0</h1>
             <p style='color: white; font-size: 20px;'>{'⭐' * int(overall_satisfaction)}</p>
         </div>
@@ -781,34 +1318,19 @@ def show_satisfaction_analysis(data):
         
         with col1:
             # 프로그램별 평균 만족도
-            prog_satisfaction = data['survey'][data['survey']['rating'].notna()].merge(
-                data['program_info'][['program_id', 'program_name']], 
-                on='program_id')
-            prog_avg = prog_satisfaction.groupby('program_name')['rating'].mean().reset_index()
-            
-            fig1 = px.bar(prog_avg, x='rating', y='program_name', orientation='h',
+            fig1 = px.bar(result['by_program'], x='rating', y='program_name', orientation='h',
                          title="프로그램별 만족도 비교",
                          color='rating',
                          color_continuous_scale=['#ffa500', '#ff5800', '#ea002c'],
                          range_x=[0, 5])
             fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
+            show_chart(fig1)
         
         with col2:
             # 질문별 평균 점수
-            question_avg = satisfaction_data.groupby('question_id').agg({
-                'rating': 'mean',
-                'question_text': 'first'
-            }).reset_index()
-            
-            question_avg['question_short'] = question_avg['question_id'].map({
-                'Q1': '전반적 만족도',
-                'Q2': '추천 의향',
-                'Q3': '실무 도움도'
-            })
-            
+            question_avg = result['by_question']
             fig2 = go.Figure(go.Scatterpolar(
-                r=question_avg['rating'],
+                r=question_avg['mean'],
                 theta=question_avg['question_short'],
                 fill='toself',
                 marker_color='#ea002c',
@@ -823,15 +1345,12 @@ def show_satisfaction_analysis(data):
                 showlegend=False,
                 title="질문별 만족도 레이더 차트"
             )
-            st.plotly_chart(fig2, use_container_width=True)
+            show_chart(fig2)
         
         # 회사별 만족도 분포
         st.markdown("#### 🏢 회사별 만족도 분포")
         
-        company_satisfaction = satisfaction_data.groupby('company')['rating'].agg(['mean', 'std', 'count']).reset_index()
-        company_satisfaction = company_satisfaction[company_satisfaction['count'] >= 5]  # 5개 이상 응답만
-        company_satisfaction = company_satisfaction.sort_values('mean', ascending=False).head(15)
-        
+        company_satisfaction = result['by_company']
         fig3 = go.Figure()
         fig3.add_trace(go.Bar(
             x=company_satisfaction['company'],
@@ -846,7 +1365,30 @@ def show_satisfaction_analysis(data):
             xaxis_tickangle=-45,
             height=500
         )
-        st.plotly_chart(fig3, use_container_width=True)
+        show_chart(fig3)
+        
+        # 전체 주관식 응답 요약
+        comments = result['comments']
+        if len(comments) > 0:
+            st.markdown("#### 💬 전체 프로그램 주요 피드백")
+            
+            # 워드 클라우드 스타일로 키워드 표시
+            keyword_html = "<div style='text-align: center; padding: 20px; background-color: #f9f9f9; border-radius: 10px;'>"
+            for word, freq in result['keywords']:
+                if freq >= OVERALL_KEYWORD_MIN_FREQ:
+                    size = min(35, 12 + freq)
+                    color = '#ea002c' if freq >= 10 else '#ff5800' if freq >= 7 else '#ffa500'
+                    keyword_html += f'<span style="font-size: {size}px; color: {color}; margin: 8px; display: inline-block; font-weight: bold;">{word}</span> '
+            keyword_html += "</div>"
+            
+            st.markdown("**자주 언급된 표현:**", unsafe_allow_html=True)
+            st.markdown(keyword_html, unsafe_allow_html=True)
+            
+            # 샘플 코멘트 표시
+            st.info("📝 수강생 주요 의견 (샘플)")
+            sample_comments = comments.sample(min(5, len(comments)))
+            for comment in sample_comments:
+                st.write(f"• {comment}")
         
     else:
         # 개별 프로그램 선택시: 상세 분석
@@ -854,11 +1396,7 @@ def show_satisfaction_analysis(data):
         # 객관식 문항별 상세 평균
         st.markdown("#### 📊 객관식 문항별 평균 평점")
         
-        objective_questions = satisfaction_data[satisfaction_data['question_type'] == '객관식']
-        question_details = objective_questions.groupby(['question_id', 'question_text']).agg({
-            'rating': ['mean', 'std', 'count']
-        }).reset_index()
-        question_details.columns = ['question_id', 'question_text', 'mean', 'std', 'count']
+        question_details = result['questions']
         
         # 문항별 상세 카드
         for _, row in question_details.iterrows():
@@ -879,14 +1417,7 @@ def show_satisfaction_analysis(data):
         
         with col1:
             # 질문별 평균 점수 비교
-            question_scores = question_details.copy()
-            question_scores['question_short'] = question_scores['question_id'].map({
-                'Q1': '전반적 만족도',
-                'Q2': '추천 의향',
-                'Q3': '실무 도움도'
-            })
-            
-            fig1 = px.bar(question_scores, x='question_short', y='mean',
+            fig1 = px.bar(question_details, x='question_short', y='mean',
                          title="객관식 문항별 평균 점수",
                          color='mean',
                          color_continuous_scale=['#ffa500', '#ff5800', '#ea002c'],
@@ -894,76 +1425,56 @@ def show_satisfaction_analysis(data):
                          text='mean')
             fig1.update_traces(texttemplate='%{text:.2f}', textposition='outside')
             fig1.update_layout(height=400, xaxis_title="", yaxis_title="평균 점수")
-            st.plotly_chart(fig1, use_container_width=True)
+            show_chart(fig1)
         
         with col2:
-            # 만족도 점수 분포
-            fig2 = px.histogram(satisfaction_data, x='rating',
-                              title="만족도 점수 분포",
-                              nbins=5,
-                              color_discrete_sequence=['#ea002c'])
-            fig2.update_layout(height=400, 
+            # 만족도 점수 분포 (점수별 응답 수만 전송)
+            fig2 = px.bar(result['distribution'], x='rating', y='count',
+                          title="만족도 점수 분포",
+                          color_discrete_sequence=['#ea002c'])
+            fig2.update_layout(height=400, bargap=0,
                              xaxis_title="만족도 점수",
                              yaxis_title="응답 수",
                              xaxis=dict(tickmode='linear', tick0=1, dtick=1))
-            st.plotly_chart(fig2, use_container_width=True)
+            show_chart(fig2)
         
         # 주관식 응답 분석
         st.markdown("#### 💬 주관식 문항 의견 요약")
         
-        subjective_data = all_survey_data[(all_survey_data['question_type'] == '주관식') & 
-                                          (all_survey_data['comment'].notna())]
-        
-        if len(subjective_data) > 0:
-            # 주관식 질문별로 그룹화
-            subjective_questions = subjective_data['question_text'].unique()
-            
-            for question in subjective_questions:
-                question_comments = subjective_data[subjective_data['question_text'] == question]['comment']
+        if len(result['subjective']) > 0:
+            # 주관식 질문별로 표시
+            for entry in result['subjective']:
+                question = entry['question']
+                question_comments = entry['comments']
+                # 자주 언급된 키워드 (상위 5개 중 KEYWORD_MIN_FREQ 회 이상)
+                frequent = [(word, freq) for word, freq in entry['keywords'][:5] if freq >= KEYWORD_MIN_FREQ]
+                
+                # 질문 표시
+                question_display = question.split(']')[1].strip() if ']' in question else question
+                st.markdown(f"**📝 {question_display}**")
                 
-                if len(question_comments) > 0:
-                    # 질문 표시
-                    question_display = question.split(']')[1].strip() if ']' in question else question
-                    st.markdown(f"**📝 {question_display}**")
-                    
-                    # 키워드 분석 (간단한 방식)
-                    # 모든 코멘트를 하나로 합치고 단어 추출
-                    all_comments = ' '.join(question_comments.values)
-                    
-                    # 의미있는 키워드 추출 (2글자 이상)
-                    words = re.findall(r'[가-힣]+', all_comments)
-                    words = [word for word in words if len(word) >= 2]
-                    
-                    # 빈도수 계산
-                    word_freq = Counter(words)
-                    top_keywords = word_freq.most_common(10)
-                    
-                    # 자주 언급되는 키워드 표시
-                    if top_keywords:
-                        keyword_html = ""
-                        for word, freq in top_keywords[:5]:
-                            if freq >= 3:  # 3회 이상 언급된 키워드만
-                                size = min(30, 15 + freq * 2)  # 빈도에 따라 크기 조정
-                                keyword_html += f'<span style="font-size: {size}px; color: #ea002c; margin: 5px; font-weight: bold;">{word}</span> '
-                        
-                        if keyword_html:
-                            st.markdown(f"**자주 언급된 키워드:** {keyword_html}", unsafe_allow_html=True)
-                    
-                    # 대표 의견 표시 (샘플)
-                    st.markdown("**주요 의견:**")
-                    sample_size = min(5, len(question_comments))
-                    for comment in question_comments.sample(sample_size).values:
-                        # 자주 언급된 키워드 강조
-                        highlighted_comment = comment
-                        for word, freq in top_keywords[:5]:
-                            if freq >= 3:
-                                highlighted_comment = highlighted_comment.replace(
-                                    word, 
-                                    f"**<span style='color: #ea002c;'>{word}</span>**"
-                                )
-                        st.markdown(f"• {highlighted_comment}", unsafe_allow_html=True)
-                    
-                    st.markdown("")  # 구분을 위한 빈 줄
+                # 자주 언급되는 키워드 표시 (빈도에 따라 크기 조정)
+                if frequent:
+                    keyword_html = ''.join(
+                        f'<span style="font-size: {min(30, 15 + freq * 2)}px; color: #ea002c; margin: 5px; font-weight: bold;">{word}</span> '
+                        for word, freq in frequent
+                    )
+                    st.markdown(f"**자주 언급된 키워드:** {keyword_html}", unsafe_allow_html=True)
+                
+                # 대표 의견 표시 (샘플)
+                st.markdown("**주요 의견:**")
+                sample_size = min(5, len(question_comments))
+                for comment in question_comments.sample(sample_size).values:
+                    # 자주 언급된 키워드 강조
+                    highlighted_comment = comment
+                    for word, _ in frequent:
+                        highlighted_comment = highlighted_comment.replace(
+                            word, 
+                            f"**<span style='color: #ea002c;'>{word}</span>**"
+                        )
+                    st.markdown(f"• {highlighted_comment}", unsafe_allow_html=True)
+                
+                st.markdown("")  # 구분을 위한 빈 줄
         
         else:
             st.info("주관식 응답이 없습니다.")
@@ -971,10 +1482,7 @@ def show_satisfaction_analysis(data):
         # 회사별 만족도 (해당 프로그램만)
         st.markdown(f"#### 🏢 {selected_prog_for_satisfaction} - 회사별 만족도")
         
-        company_prog_satisfaction = satisfaction_data.groupby('company')['rating'].agg(['mean', 'count']).reset_index()
-        company_prog_satisfaction = company_prog_satisfaction[company_prog_satisfaction['count'] >= 3]  # 3개 이상 응답만
-        company_prog_satisfaction = company_prog_satisfaction.sort_values('mean', ascending=False)
-        
+        company_prog_satisfaction = result['by_company']
         if len(company_prog_satisfaction) > 0:
             fig3 = px.bar(company_prog_satisfaction, x='company', y='mean',
                          title=f"회사별 만족도 평균",
@@ -983,38 +1491,7 @@ def show_satisfaction_analysis(data):
                          range_y=[0, 5])
             fig3.update_layout(xaxis_tickangle=-45, height=400,
                              xaxis_title="회사", yaxis_title="평균 만족도")
-            st.plotly_chart(fig3, use_container_width=True)
-    
-    # 전체 주관식 응답 요약 (전체 선택시에만)
-    if selected_prog_for_satisfaction == '전체':
-        comments = all_survey_data[all_survey_data['comment'].notna()]['comment']
-        if len(comments) > 0:
-            st.markdown("#### 💬 전체 프로그램 주요 피드백")
-            
-            # 키워드 분석
-            all_comments = ' '.join(comments.values)
-            words = re.findall(r'[가-힣]+', all_comments)
-            words = [word for word in words if len(word) >= 2]
-            word_freq = Counter(words)
-            top_keywords = word_freq.most_common(15)
-            
-            # 워드 클라우드 스타일로 키워드 표시
-            keyword_html = "<div style='text-align: center; padding: 20px; background-color: #f9f9f9; border-radius: 10px;'>"
-            for word, freq in top_keywords:
-                if freq >= 5:
-                    size = min(35, 12 + freq)
-                    color = '#ea002c' if freq >= 10 else '#ff5800' if freq >= 7 else '#ffa500'
-                    keyword_html += f'<span style="font-size: {size}px; color: {color}; margin: 8px; display: inline-block; font-weight: bold;">{word}</span> '
-            keyword_html += "</div>"
-            
-            st.markdown("**자주 언급된 표현:**", unsafe_allow_html=True)
-            st.markdown(keyword_html, unsafe_allow_html=True)
-            
-            # 샘플 코멘트 표시
-            st.info("📝 수강생 주요 의견 (샘플)")
-            sample_comments = comments.sample(min(5, len(comments)))
-            for comment in sample_comments:
-                st.write(f"• {comment}")
+            show_chart(fig3)
 
 # 메인 함수
 def main():
@@ -1026,8 +1503,18 @@ def main():
     if 'filter_months' not in st.session_state:
         st.session_state.filter_months = []
     
+    # 성능 측정 시작 (꺼져 있으면 기록하지 않음)
+    start_spans(debug_enabled())
+    
     # 데이터 로드
-    data = load_data()
+    with timed('load_data'):
+        data = load_dataset()
+    
+    # 워크북이 바뀌어 새 스냅샷으로 교체되었으면 알림
+    if data is not None:
+        if st.session_state.get('data_version') not in (None, data['version']):
+            st.toast("📥 워크북 변경 사항이 반영되었습니다.")
+        st.session_state['data_version'] = data['version']
     
     if data is None:
         # 파일을 찾을 수 없을 때 바로 업로드 인터페이스 제공 (오류 메시지 없이)
@@ -1039,26 +1526,8 @@ def main():
         
         if uploaded_file is not None:
             try:
-                # 업로드된 파일로부터 데이터 로드
-                data = {
-                    'program_info': pd.read_excel(uploaded_file, sheet_name='Program_Info'),
-                    'learners': pd.read_excel(uploaded_file, sheet_name='Learners'),
-                    'certification': pd.read_excel(uploaded_file, sheet_name='Certification'),
-                    'budget': pd.read_excel(uploaded_file, sheet_name='Budget'),
-                    'instructors': pd.read_excel(uploaded_file, sheet_name='Instructors'),
-                    'survey': pd.read_excel(uploaded_file, sheet_name='Survey')
-                }
-                
-                # 날짜 형식 변환
-                data['program_info']['program_month'] = pd.to_datetime(data['program_info']['program_month'])
-                
-                # 예산 계산 추가
-                data['budget']['actual_budget'] = data['budget']['dev_cost'] + data['budget']['instructor_fee'] + data['budget']['reserve_fund']
-                
-                # 직접비 총액 계산
-                for idx, row in data['budget'].iterrows():
-                    prog = data['program_info'][data['program_info']['program_id'] == row['program_id']].iloc[0]
-                    data['budget'].loc[idx, 'total_direct_cost'] = row['direct_cost'] * prog['num_learners']
+                # 업로드된 파일로부터 데이터 로드 (같은 파일은 다시 파싱하지 않음)
+                data = load_uploaded_data(upload_digest(uploaded_file), uploaded_file.getvalue())
                 
                 st.success("✅ 파일이 성공적으로 로드되었습니다!")
                 st.balloons()
@@ -1076,7 +1545,10 @@ def main():
     selected_program, selected_companies, selected_months = setup_sidebar_filters(data)
     
     # 필터가 적용된 데이터 가져오기
-    filtered_data = apply_filters(data)
+    with timed('apply_filters') as span:
+        filtered_data = apply_filters(data)
+        if span:
+            span['rows'] = sum(len(filtered_data[key]) for key in PROGRAM_TABLES)
     
     # 필터 적용 알림
     if (st.session_state.get('filter_program', '전체') != '전체' or 
@@ -1084,45 +1556,21 @@ def main():
         len(st.session_state.get('filter_months', [])) > 0):
         st.info("🔍 필터가 적용되었습니다. 좌측 사이드바에서 필터를 변경할 수 있습니다.")
     
-    # 탭 생성 (페이지 선택을 탭으로 변경)
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🏠 Overview", 
-        "🎓 프로그램별 상세", 
-        "👥 수강생 분석", 
-        "💰 예산 분석", 
-        "⭐ 만족도 분석"
-    ])
-    
-    # 각 탭에 해당 페이지 내용 표시 (필터링된 데이터 사용)
-    with tab1:
-        if len(filtered_data['program_info']) > 0:
-            show_overview(filtered_data)
-        else:
-            st.warning("⚠️ 선택한 필터 조건에 해당하는 데이터가 없습니다.")
-    
-    with tab2:
-        if len(filtered_data['program_info']) > 0:
-            show_program_details(filtered_data, st.session_state.get('filter_program', '전체'))
-        else:
-            st.warning("⚠️ 선택한 필터 조건에 해당하는 프로그램이 없습니다.")
-    
-    with tab3:
-        if len(filtered_data['learners']) > 0:
-            show_learner_analysis(filtered_data)
-        else:
-            st.warning("⚠️ 선택한 필터 조건에 해당하는 수강생이 없습니다.")
-    
-    with tab4:
-        if len(filtered_data['budget']) > 0:
-            show_budget_analysis(filtered_data)
-        else:
-            st.warning("⚠️ 선택한 필터 조건에 해당하는 예산 정보가 없습니다.")
+    # 페이지 선택 (선택한 페이지만 계산해서 표시)
+    page = st.radio(
+        "페이지 선택",
+        list(PAGES),
+        horizontal=True,
+        key="active_page",
+        label_visibility="collapsed"
+    )
     
-    with tab5:
-        if len(filtered_data['survey']) > 0:
-            show_satisfaction_analysis(filtered_data)
-        else:
-            st.warning("⚠️ 선택한 필터 조건에 해당하는 만족도 데이터가 없습니다.")
+    table, empty_message, render = PAGES[page]
+    if len(filtered_data[table]) > 0:
+        with timed(f"page:{page}", rows=len(filtered_data[table])):
+            render(filtered_data)
+    else:
+        st.warning(empty_message)
     
     # 푸터
     st.markdown("---")
@@ -1134,9 +1582,40 @@ def main():
         </div>
         """, unsafe_allow_html=True
     )
+    
+    # 성능 측정 결과 (켜져 있을 때만)
+    finish_spans(data, page)
+    
+    # 자주 쓰는 필터 조합 미리 계산 (데이터 버전별로 한 번, 백그라운드)
+    if warmup_enabled():
+        get_warmup_scheduler().schedule(data)
+
+# 페이지 목록: 이름 -> (데이터 확인 테이블, 데이터가 없을 때 안내, 렌더 함수)
+PAGES = {
+    "🏠 Overview": (
+        'program_info', "⚠️ 선택한 필터 조건에 해당하는 데이터가 없습니다.",
+        show_overview),
+    "🎓 프로그램별 상세": (
+        'program_info', "⚠️ 선택한 필터 조건에 해당하는 프로그램이 없습니다.",
+        lambda data: show_program_details(data, st.session_state.get('filter_program', '전체'))),
+    "👥 수강생 분석": (
+        'learners', "⚠️ 선택한 필터 조건에 해당하는 수강생이 없습니다.",
+        show_learner_analysis),
+    "💰 예산 분석": (
+        'budget', "⚠️ 선택한 필터 조건에 해당하는 예산 정보가 없습니다.",
+        show_budget_analysis),
+    "⭐ 만족도 분석": (
+        'survey', "⚠️ 선택한 필터 조건에 해당하는 만족도 데이터가 없습니다.",
+        show_satisfaction_analysis),
+}
 
 if __name__ == "__main__":
-    main()
+    # 화면 실행 중에는 백그라운드 미리 계산이 기다림
+    with get_warmup_scheduler().foreground():
+        if profile_requested():
+            run_profiled(main)
+        else:
+            main()
 
 
 
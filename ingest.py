@@ -0,0 +1,641 @@
+"""엑셀 워크북 수집(ingestion) 레이어
+
+대시보드가 사용하는 6개 시트를 한 번의 워크북 열기로 읽어 DataFrame 으로 변환합니다.
+Streamlit 에 의존하지 않으므로 스크립트나 배치 작업에서도 그대로 사용할 수 있습니다.
+"""
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+logger = logging.getLogger(__name__)
+
+# 파싱 결과를 저장하는 디스크 캐시 위치 (환경변수로 변경 가능)
+CACHE_DIR = os.environ.get(
+    'DASHBOARD_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dashboard_cache'),
+)
+# 캐시에 저장되는 테이블 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 4
+# 보관할 캐시 엔트리 수 (오래된 것부터 삭제)
+CACHE_KEEP = 5
+
+# 데이터 키 -> 엑셀 시트명
+SHEETS = {
+    'program_info': 'Program_Info',
+    'learners': 'Learners',
+    'certification': 'Certification',
+    'budget': 'Budget',
+    'instructors': 'Instructors',
+    'survey': 'Survey',
+}
+
+# total_budget 이 비어 있을 때 합산해 예산으로 사용하는 항목
+BUDGET_COMPONENTS = ['dev_cost', 'instructor_fee', 'reserve_fund']
+
+# 시트별 명시적 dtype (ID 컬럼이 숫자로 추론되지 않도록 문자열로 고정)
+SHEET_DTYPES = {
+    'program_info': {'program_id': str},
+    'learners': {'learner_id': str, 'program_id': str},
+    'certification': {'program_id': str},
+    'budget': {'program_id': str},
+    'instructors': {'program_id': str, 'instructor_id': str},
+    'survey': {'program_id': str, 'question_id': str},
+}
+
+# 대시보드에서 사용하는 시트별 컬럼 (이 외의 컬럼은 읽지 않음)
+SHEET_COLUMNS = {
+    'program_info': ['program_id', 'program_name', 'job_category', 'owner', 'program_month',
+                     'duration_days', 'target_company', 'num_learners', 'venue'],
+    'learners': ['learner_id', 'program_id', 'company', 'dept', 'job_level'],
+    'certification': ['program_id', 'certification_type', 'exam_candidates', 'exam_passed'],
+    'budget': ['program_id', 'total_budget', *BUDGET_COMPONENTS, 'direct_cost'],
+    'instructors': ['program_id', 'instructor_id', 'instructor_name', 'lecture_hours', 'lecture_fee'],
+    'survey': ['program_id', 'company', 'question_id', 'question_text', 'question_type', 'rating', 'comment'],
+}
+
+# 파싱 방식 (환경변수 DASHBOARD_INGEST): 'pandas' / 'stream' / 'auto'(워크북 크기로 결정)
+INGEST_MODE = os.environ.get('DASHBOARD_INGEST', 'auto')
+# auto 모드에서 스트리밍 파싱을 사용하는 워크북 크기 (bytes)
+STREAM_MIN_BYTES = 32 * 1024 * 1024
+# 스트리밍 파싱에서 한 번에 Arrow RecordBatch 로 변환하는 행 수
+STREAM_CHUNK_ROWS = 50000
+
+# 로드 후 적용하는 컬럼 타입 (종류가 적은 문자열은 category, 고유값이 많은 문자열은 Arrow 문자열, 평점은 Int8)
+# source 는 여러 워크북을 합친 데이터셋에서만 있는 원본 워크북 이름 컬럼
+ARROW_STRING = pd.StringDtype('pyarrow')
+SCHEMA = {
+    'program_info': {'source': 'category', 'program_id': 'category'},
+    'learners': {
+        'source': 'category',
+        'learner_id': ARROW_STRING,
+        'program_id': 'category',
+        'company': 'category',
+        'dept': 'category',
+        'job_level': 'category',
+    },
+    'certification': {'source': 'category', 'program_id': 'category'},
+    'budget': {'source': 'category', 'program_id': 'category'},
+    'instructors': {'source': 'category', 'program_id': 'category', 'instructor_id': 'category'},
+    'survey': {
+        'source': 'category',
+        'program_id': 'category',
+        'company': 'category',
+        'question_id': 'category',
+        'question_type': 'category',
+        'question_text': 'category',
+        'rating': 'Int8',
+        'comment': ARROW_STRING,
+    },
+}
+
+
+class WorkbookError(ValueError):
+    """워크북 내용이 대시보드 스키마와 맞지 않을 때 발생"""
+
+
+# 다른 시트에서 파생 컬럼을 계산하는 테이블 (해당 시트가 바뀌면 함께 다시 계산)
+DERIVED_FROM = {
+    'budget': {'program_info'},
+}
+
+
+def read_workbook(source, keys=None, streaming=None):
+    """워크북을 한 번만 열어 모든 시트(keys 를 주면 해당 시트만)를 읽습니다.
+
+    source 는 파일 경로 또는 파일 객체(업로드 파일 등)입니다. 시트별로 SHEET_COLUMNS 컬럼만 읽으며,
+    streaming 이 True 이면 openpyxl read_only 모드로 행을 나눠 읽습니다 (None 이면 INGEST_MODE 로 결정).
+    (시트별 DataFrame dict, 시트별 소요 시간(초) dict) 를 반환합니다.
+    """
+    if streaming is None:
+        streaming = _use_streaming(source)
+
+    timings = {}
+    started = time.perf_counter()
+    if streaming:
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    else:
+        workbook = pd.ExcelFile(source, engine='openpyxl')
+    try:
+        timings['open'] = time.perf_counter() - started
+
+        data = {}
+        for key, sheet_name in SHEETS.items():
+            if keys is not None and key not in keys:
+                continue
+            sheet_started = time.perf_counter()
+            if streaming:
+                data[key] = stream_sheet(workbook[sheet_name], SHEET_COLUMNS[key], SHEET_DTYPES[key])
+            else:
+                data[key] = workbook.parse(sheet_name, dtype=SHEET_DTYPES[key],
+                                           usecols=lambda column, key=key: column in SHEET_COLUMNS[key])
+            timings[sheet_name] = time.perf_counter() - sheet_started
+    finally:
+        workbook.close()
+
+    timings['total'] = time.perf_counter() - started
+    logger.info(
+        "워크북 로드 완료 (%s, %.2fs): %s",
+        '스트리밍' if streaming else 'pandas',
+        timings['total'],
+        ', '.join(f"{name}={seconds:.2f}s" for name, seconds in timings.items() if name != 'total'),
+    )
+    return data, timings
+
+
+def load_workbook(source, digest=None, prune=True):
+    """디스크 캐시를 거쳐 워크북을 로드합니다.
+
+    source 는 파일 경로 또는 업로드 파일의 bytes 입니다. 같은 내용(digest)의 캐시가 있으면
+    파싱 없이 캐시를 읽고, 없으면 파싱과 파생 컬럼 계산 후 캐시에 저장합니다.
+    prune 이 False 이면 저장 후 오래된 캐시를 정리하지 않습니다 (load_directory 가 한 번에 정리).
+    (시트별 DataFrame dict, 단계별 소요 시간(초) dict) 를 반환하며, 소요 시간에는 항상 'total' 이 있습니다.
+    """
+    if digest is None:
+        digest = file_digest(source)
+
+    started = time.perf_counter()
+    cached = read_cache(digest)
+    if cached is not None:
+        elapsed = time.perf_counter() - started
+        return cached, {'cache': elapsed, 'total': elapsed}
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    data, timings = read_workbook(source)
+
+    derive_started = time.perf_counter()
+    derive_columns(data)
+    apply_schema(data)
+    timings['derive'] = time.perf_counter() - derive_started
+    logger.info("테이블 메모리 사용량:\n%s", memory_report(data).to_string(index=False))
+
+    # 파생 컬럼까지 포함해 캐시에 저장 (다음 실행부터는 XML 파싱 없이 로드)
+    write_cache(digest, data, prune=prune)
+    return data, timings
+
+
+def _use_streaming(source):
+    """INGEST_MODE 와 워크북 크기로 스트리밍 파싱 여부를 결정"""
+    if INGEST_MODE in ('stream', 'pandas'):
+        return INGEST_MODE == 'stream'
+    if isinstance(source, io.BytesIO):
+        size = source.getbuffer().nbytes
+    elif isinstance(source, (str, os.PathLike)):
+        size = os.path.getsize(source)
+    else:
+        return False
+    return size >= STREAM_MIN_BYTES
+
+
+def _cell_text(value):
+    """문자열로 고정하는 컬럼의 셀 값 변환 (pandas 와 같게 정수 값의 실수는 정수로 표기)"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _arrow_array(values, text):
+    """셀 값 리스트를 Arrow 배열로 변환 (타입이 섞여 변환할 수 없으면 문자열 배열)"""
+    if text:
+        values = [None if value is None else _cell_text(value) for value in values]
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def stream_sheet(worksheet, columns, dtypes=None, chunk_rows=STREAM_CHUNK_ROWS):
+    """read_only 워크시트에서 columns 컬럼만 chunk_rows 행씩 Arrow RecordBatch 로 변환해 DataFrame 으로 반환합니다.
+
+    파이썬 객체로 들고 있는 셀 값은 최대 chunk_rows 행이므로 시트가 커도 최대 메모리가 제한됩니다.
+    첫 행을 헤더로 사용하고, 선택한 컬럼이 모두 비어 있는 행은 건너뜁니다.
+    """
+    text_columns = {column for column, dtype in (dtypes or {}).items() if dtype is str}
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None) or ()
+    projected = [(position, name) for position, name in enumerate(header) if name in columns]
+    names = [name for _, name in projected]
+
+    batches = []
+    buffer = [[] for _ in projected]
+
+    def flush():
+        arrays = [_arrow_array(values, name in text_columns) for name, values in zip(names, buffer)]
+        batches.append(pa.RecordBatch.from_arrays(arrays, names=names))
+        for values in buffer:
+            values.clear()
+
+    for row in rows:
+        values = [row[position] if position < len(row) else None for position, _ in projected]
+        if all(value is None for value in values):
+            continue
+        for column_values, value in zip(buffer, values):
+            column_values.append(value)
+        if len(buffer[0]) >= chunk_rows:
+            flush()
+    if projected and (buffer[0] or not batches):
+        flush()
+
+    if not batches:
+        return pd.DataFrame(columns=names)
+    try:
+        # 청크마다 추론된 타입이 다르면 (예: 정수 / 실수) 넓은 타입으로 맞춤
+        table = pa.concat_tables([pa.Table.from_batches([batch]) for batch in batches],
+                                 promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = pd.concat([batch.to_pandas(coerce_temporal_nanoseconds=True) for batch in batches], ignore_index=True)
+    else:
+        df = table.to_pandas(coerce_temporal_nanoseconds=True)
+
+    # pd.read_excel 과 같게 문자열 컬럼의 빈 셀은 None 대신 NaN
+    for name in df.columns[df.dtypes == object]:
+        df[name] = df[name].where(df[name].notna(), np.nan)
+    return df
+
+
+def list_workbooks(directory):
+    """디렉터리의 .xlsx 워크북 경로 목록 (이름순, 엑셀이 만드는 ~$ 임시 파일 제외)"""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith('.xlsx') and not name.startswith('~$')
+    )
+
+
+def load_directory(directory, max_workers=None):
+    """디렉터리의 워크북(같은 6개 시트 구성)을 모두 읽어 하나의 데이터셋으로 합칩니다.
+
+    디스크 캐시에 없는 워크북만 프로세스 풀에서 병렬로 파싱하므로, 워크북을 추가해도
+    기존 워크북은 다시 파싱하지 않습니다. 워크북 이름(확장자 제외)이 source 가 되며,
+    program_id 는 'source:program_id' 로 바꾸고 모든 테이블에 source 컬럼을 추가합니다.
+    (테이블 dict, 워크북별 소요 시간(초) dict, 전체 내용 해시) 를 반환합니다.
+    """
+    paths = list_workbooks(directory)
+    if not paths:
+        raise WorkbookError(f"디렉터리에 워크북(.xlsx)이 없습니다: {directory}")
+
+    started = time.perf_counter()
+    sources = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    digests = [file_digest(path) for path in paths]
+
+    # 캐시에 있는 워크북은 현재 프로세스에서 메모리 매핑으로 읽고, 나머지만 병렬 파싱
+    parts, timings, missing = {}, {}, []
+    for source, path, digest in zip(sources, paths, digests):
+        source_started = time.perf_counter()
+        cached = read_cache(digest)
+        if cached is None:
+            missing.append((source, path, digest))
+        else:
+            parts[source] = cached
+            timings[source] = time.perf_counter() - source_started
+
+    # 워크북별로 캐시를 정리하면 CACHE_KEEP 보다 워크북이 많을 때 서로의 캐시를 지우므로 마지막에 한 번만 정리
+    if len(missing) == 1:
+        source, path, digest = missing[0]
+        parts[source], source_timings = load_workbook(path, digest, prune=False)
+        timings[source] = source_timings['total']
+    elif missing:
+        # Streamlit 서버의 스레드를 복제하지 않도록 spawn 으로 작업 프로세스 생성
+        workers = min(len(missing), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            results = pool.map(load_workbook, [path for _, path, _ in missing], [digest for _, _, digest in missing],
+                               [False] * len(missing))
+            for (source, _, _), (data, source_timings) in zip(missing, results):
+                parts[source] = data
+                timings[source] = source_timings['total']
+    if missing and os.path.isdir(CACHE_DIR):
+        _prune_cache(keep=digests)
+
+    data = combine_sources([(source, parts[source]) for source in sources])
+    timings['total'] = time.perf_counter() - started
+    logger.info("워크북 %d개 로드 완료 (%.2fs, 새로 파싱 %d개)", len(paths), timings['total'], len(missing))
+
+    combined = hashlib.sha256()
+    for source, digest in zip(sources, digests):
+        combined.update(f"{source}:{digest}\n".encode('utf-8'))
+    return data, timings, combined.hexdigest()
+
+
+def combine_sources(parts):
+    """(source, 테이블 dict) 목록을 source 순서대로 이어 붙인 테이블 dict 로 합칩니다.
+
+    program_id 는 'source:program_id' 로 바꾸고, 여러 워크북에 같은 프로그램명이 있으면
+    구분할 수 있도록 프로그램명 뒤에 ' (source)' 를 붙입니다.
+    """
+    data = {}
+    for key in SHEETS:
+        tables = []
+        for source, part in parts:
+            table = part[key]
+            program_ids = table['program_id'].astype(object)
+            tables.append(table.assign(
+                source=source,
+                program_id=program_ids.where(program_ids.isna(), source + ':' + program_ids.astype(str)),
+            ))
+        data[key] = pd.concat(tables, ignore_index=True)
+
+    program_info = data['program_info']
+    names = program_info['program_name']
+    source_count = program_info.groupby('program_name')['source'].transform('nunique')
+    program_info['program_name'] = names.where(source_count <= 1, names + ' (' + program_info['source'] + ')')
+
+    apply_schema(data)
+    return data
+
+
+def reload_workbook(source, previous, changed_sheets, digest=None):
+    """바뀐 시트(changed_sheets)만 다시 파싱하고 나머지 테이블은 previous 에서 그대로 가져옵니다.
+
+    previous 의 DataFrame 은 수정하지 않습니다 (파생 컬럼을 다시 계산할 테이블은 복사본 사용).
+    changed_sheets 가 비어 있으면 (파일만 바뀐 경우) 전체를 다시 파싱하고 캐시에는 저장하지 않습니다.
+    (새 DataFrame dict, 단계별 소요 시간(초) dict, 파생 컬럼까지 반영한 변경 테이블 집합) 을 반환합니다.
+    """
+    if digest is None:
+        digest = file_digest(source)
+    changed_sheets = set(changed_sheets)
+    changed = changed_sheets | {key for key, sources in DERIVED_FROM.items() if sources & changed_sheets}
+
+    if not changed_sheets:
+        # 파일은 바뀌었는데 바뀐 시트가 없으면 시트 해시를 믿을 수 없으므로 전체를 새로 읽음
+        changed = set(SHEETS)
+
+    started = time.perf_counter()
+    cached = read_cache(digest)
+    if cached is not None:
+        elapsed = time.perf_counter() - started
+        return cached, {'cache': elapsed, 'total': elapsed}, changed
+
+    if not changed_sheets:
+        logger.warning("워크북은 바뀌었지만 바뀐 시트를 찾지 못해 전체를 다시 파싱합니다.")
+        data, timings = read_workbook(source)
+        derive_started = time.perf_counter()
+        derive_columns(data)
+        apply_schema(data)
+        timings['derive'] = time.perf_counter() - derive_started
+        # 시트 해시와 파일 내용이 어긋난 상태이므로 캐시에는 저장하지 않음 (다음 전체 로드에서 저장)
+        return data, timings, changed
+
+    parsed, timings = read_workbook(source, keys=changed_sheets)
+    data = {key: parsed[key] if key in parsed else previous[key] for key in SHEETS}
+
+    derive_started = time.perf_counter()
+    if changed & ({'program_info'} | set(DERIVED_FROM)):
+        # 파생 컬럼 계산은 테이블을 직접 수정하므로 다시 파싱하지 않은 테이블은 복사본에 계산
+        for key in ['program_info', *DERIVED_FROM]:
+            if key not in parsed:
+                data[key] = data[key].copy()
+        derive_columns(data)
+    apply_schema(data, keys=changed)
+    timings['derive'] = time.perf_counter() - derive_started
+
+    write_cache(digest, data)
+    return data, timings, changed
+
+
+def derive_columns(data):
+    """날짜 변환과 예산(actual_budget), 직접비 총액(total_direct_cost) 파생 컬럼을 계산합니다.
+
+    예산은 total_budget 을 사용하되, 비어 있으면 BUDGET_COMPONENTS 합계로 대체합니다.
+    직접비 총액은 Budget 의 program_id 를 Program_Info 의 수강생 수에 한 번에 매핑해 계산하며,
+    Program_Info 의 중복 ID 나 Program_Info 에 없는 Budget ID 가 있으면 WorkbookError 를 발생시킵니다.
+    """
+    program_info = data['program_info']
+    budget = data['budget']
+
+    # 날짜 형식 변환
+    program_info['program_month'] = pd.to_datetime(program_info['program_month'])
+
+    # program_id 검증 (중복 / 누락)
+    duplicated = program_info['program_id'][program_info['program_id'].duplicated()].unique()
+    if len(duplicated) > 0:
+        raise WorkbookError(f"Program_Info 시트에 중복된 program_id 가 있습니다: {', '.join(map(str, duplicated))}")
+
+    num_learners = budget['program_id'].map(program_info.set_index('program_id')['num_learners'])
+    missing = budget['program_id'][~budget['program_id'].isin(program_info['program_id'])].unique()
+    if len(missing) > 0:
+        raise WorkbookError(f"Program_Info 시트에 없는 program_id 가 Budget 시트에 있습니다: {', '.join(map(str, missing))}")
+
+    # 예산 = total_budget (없으면 항목 합계)
+    budget['actual_budget'] = budget['total_budget'].fillna(
+        budget[BUDGET_COMPONENTS].sum(axis=1, min_count=1)
+    )
+
+    # 직접비 총액 = 1인당 직접비 x 수강생 수
+    budget['total_direct_cost'] = budget['direct_cost'] * num_learners
+    return data
+
+
+def apply_schema(data, keys=None):
+    """SCHEMA 에 정의된 컬럼 타입을 적용합니다 (keys 를 주면 해당 테이블만, 해당 컬럼이 없는 시트는 건너뜀).
+
+    평점이 정수가 아니거나 Int8 범위를 벗어나면 float32 로 저장합니다.
+    """
+    for key, columns in SCHEMA.items():
+        if keys is not None and key not in keys:
+            continue
+        df = data[key]
+        for column, dtype in columns.items():
+            if column not in df:
+                continue
+            values = df[column]
+            if dtype == 'Int8':
+                numbers = pd.to_numeric(values, errors='coerce')
+                integral = numbers.dropna()
+                if ((integral % 1 == 0) & integral.between(-128, 127)).all():
+                    df[column] = numbers.astype('Int8')
+                else:
+                    df[column] = numbers.astype('float32')
+            elif dtype == ARROW_STRING:
+                # 숫자 / 문자열이 섞인 셀도 문자열로 통일 (결측값은 유지)
+                df[column] = values.where(values.isna(), values.astype(str)).astype(dtype)
+            else:
+                df[column] = values.astype(dtype)
+    return data
+
+
+def memory_report(data):
+    """테이블별 행 수와 메모리 사용량(문자열 포함, bytes)을 DataFrame 으로 반환합니다."""
+    rows = []
+    for key in SHEETS:
+        df = data[key]
+        usage = int(df.memory_usage(deep=True).sum())
+        rows.append({
+            'table': key,
+            'rows': len(df),
+            'columns': df.shape[1],
+            'bytes': usage,
+            'bytes_per_row': round(usage / len(df), 1) if len(df) > 0 else 0,
+        })
+    return pd.DataFrame(rows)
+
+
+def file_digest(source, chunk_size=1 << 20):
+    """파일 경로 또는 bytes 의 내용 해시(sha256)를 계산합니다."""
+    hasher = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        hasher.update(source)
+    else:
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# 시트 XML 에서 셀(<c>)과 공유 문자열 목록(<si>)을 찾는 패턴
+_CELL = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_VALUE = re.compile(rb'<v>(\d+)</v>')
+_SHARED_STRING = re.compile(rb'<si\b.*?</si>', re.S)
+# 빈 시트는 <sheetData/> (셀의 <c .../> 에서 멈추지 않도록 요소 전체를 찾음)
+_SHEET_DATA = re.compile(rb'<sheetData\b[^>]*/>|<sheetData\b.*?</sheetData>', re.S)
+_XLSX_NS = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+_XLSX_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+
+def sheet_digests(source):
+    """시트별 내용 해시(sha256)를 계산합니다 (워크북을 파싱하지 않고 xlsx(zip) 안의 XML 만 읽음).
+
+    시트의 셀(<sheetData>)만 공유 문자열을 풀어서 해시하므로, 선택한 셀이나 열 너비처럼
+    데이터와 무관한 변경이나 다른 시트의 수정은 해시에 반영되지 않습니다.
+    source 는 파일 경로 또는 bytes 이며, 데이터 키 -> 해시 dict 를 반환합니다.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    try:
+        with zipfile.ZipFile(source) as archive:
+            workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+            rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+            targets = {rel.get('Id'): rel.get('Target') for rel in rels.findall('rel:Relationship', _XLSX_NS)}
+            parts = {
+                sheet.get('name'): targets[sheet.get(_XLSX_REL_ID)]
+                for sheet in workbook.findall('main:sheets/main:sheet', _XLSX_NS)
+            }
+            names = set(archive.namelist())
+            shared = (_SHARED_STRING.findall(archive.read('xl/sharedStrings.xml'))
+                      if 'xl/sharedStrings.xml' in names else [])
+
+            digests = {}
+            for key, sheet_name in SHEETS.items():
+                if sheet_name not in parts:
+                    continue
+                target = parts[sheet_name]
+                part = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+                sheet_data = _SHEET_DATA.search(archive.read(part))
+                sheet_data = sheet_data.group(0) if sheet_data else b''
+
+                # 공유 문자열 셀은 인덱스 대신 문자열 내용으로 해시 (저장할 때 번호가 바뀌어도 같은 해시)
+                hasher = hashlib.sha256()
+                for attributes, body in _CELL.findall(sheet_data):
+                    value = _VALUE.search(body) if b't="s"' in attributes else None
+                    if value:
+                        index = int(value.group(1))
+                        body = shared[index] if index < len(shared) else b''
+                    hasher.update(attributes + b'\0' + body + b'\0')
+                digests[key] = hasher.hexdigest()
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise WorkbookError(f"워크북 구조를 읽을 수 없습니다: {e}") from e
+    return digests
+
+
+def _cache_path(digest):
+    return os.path.join(CACHE_DIR, f"{digest[:32]}-v{CACHE_VERSION}")
+
+
+def read_cache(digest):
+    """캐시된 테이블을 메모리 매핑으로 읽습니다. 캐시가 없으면 None 을 반환합니다."""
+    path = _cache_path(digest)
+    manifest_path = os.path.join(path, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        data = {}
+        for key in manifest['tables']:
+            table = feather.read_table(os.path.join(path, f"{key}.feather"), memory_map=True)
+            # 문자열 컬럼은 Arrow 버퍼를 그대로 쓰는 string[pyarrow] 로 복원
+            with pd.option_context('mode.string_storage', 'pyarrow'):
+                data[key] = table.to_pandas()
+    except (OSError, ValueError, KeyError, pa.ArrowException) as e:
+        logger.warning("캐시를 읽지 못해 워크북을 다시 파싱합니다 (%s): %s", path, e)
+        return None
+
+    # 캐시 사용 기록 (정리 시 최근 사용 순서 판단용)
+    try:
+        os.utime(manifest_path)
+    except OSError:
+        pass
+    return data
+
+
+def write_cache(digest, data, prune=True):
+    """테이블을 Feather(Arrow IPC, 비압축) 파일로 저장합니다.
+
+    임시 디렉터리에 모두 쓴 뒤 이름을 바꾸므로, 다른 프로세스가 쓰다 만 캐시를 읽지 않습니다.
+    같은 digest 의 캐시가 이미 있으면 (read_cache 가 읽지 못한 손상된 캐시) 새로 쓴 캐시로 교체합니다.
+    prune 이 True 이면 저장 후 오래된 캐시를 정리합니다.
+    """
+    path = _cache_path(digest)
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=CACHE_DIR)
+        for key, df in data.items():
+            feather.write_feather(df, os.path.join(tmp_path, f"{key}.feather"),
+                                  compression='uncompressed')
+        with open(os.path.join(tmp_path, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump({'digest': digest, 'tables': list(data)}, f)
+        if os.path.exists(path):
+            # 디렉터리는 덮어쓸 수 없으므로 기존 캐시를 임시 이름으로 옮긴 뒤 교체하고 삭제
+            stale_path = f"{tmp_path}-stale"
+            os.replace(path, stale_path)
+            os.replace(tmp_path, path)
+            shutil.rmtree(stale_path, ignore_errors=True)
+        else:
+            os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException) as e:
+        # 읽기 전용 환경 등에서는 캐시 없이 동작
+        logger.warning("캐시를 저장하지 못했습니다 (%s): %s", path, e)
+        if tmp_path is not None:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return
+
+    if prune:
+        _prune_cache()
+
+
+def _prune_cache(keep=()):
+    """최근 사용한 CACHE_KEEP 개만 남기고 오래된 캐시를 삭제합니다.
+
+    keep 의 digest 캐시는 CACHE_KEEP 보다 많아도 모두 남깁니다 (디렉터리 모드에서 사용 중인 워크북).
+    """
+    keep = {os.path.basename(_cache_path(digest)) for digest in keep}
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        manifest_path = os.path.join(CACHE_DIR, name, 'manifest.json')
+        if os.path.exists(manifest_path):
+            entries.append((name in keep, os.path.getmtime(manifest_path), name))
+
+    for _, _, name in sorted(entries, reverse=True)[max(CACHE_KEEP, len(keep)):]:
+        shutil.rmtree(os.path.join(CACHE_DIR, name), ignore_errors=True)
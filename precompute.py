@@ -0,0 +1,227 @@
+"""대시보드 화면 사전 계산 (precompute)
+
+워크북을 읽어 필터 없는 화면과 프로그램별 화면의 페이지 결과(KPI, 프로그램 상세, 예산, 만족도 / 키워드 등)를
+미리 계산해 워크북 내용 해시별 아티팩트 디렉터리에 저장합니다. 대시보드는 같은 데이터 버전의 아티팩트가 있으면
+인덱스 / 큐브와 페이지 결과를 계산하지 않고 읽어서 사용합니다. 화면별 계산은 프로세스 풀에서 나눠 실행합니다.
+
+사용 예:
+    python dashboard.py precompute --workbook dashboard_template.xlsx
+    python dashboard.py precompute --data-dir workbooks/ --workers 4
+
+아티팩트는 pickle 이므로 직접 만든 디렉터리의 것만 읽도록 ARTIFACT_DIR 은 신뢰하는 위치로 지정합니다.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import ingest
+from analytics import Filters, filter_dataset, page_results, prepare_dataset
+
+logger = logging.getLogger(__name__)
+
+# 사전 계산 결과 저장 위치 (환경변수로 변경 가능)
+ARTIFACT_DIR = os.environ.get(
+    'DASHBOARD_ARTIFACT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dashboard_artifacts'),
+)
+# 저장하는 결과 형식(analytics 결과 구조)이 바뀌면 올려서 기존 아티팩트를 무효화
+ARTIFACT_VERSION = 1
+# 보관할 아티팩트 수 (오래된 것부터 삭제)
+ARTIFACT_KEEP = 3
+# 인덱스 / 큐브 / 키워드 인덱스 / 프로그램 번들 파일
+DERIVED_FILE = 'derived.pkl'
+
+
+def artifact_path(digest):
+    # 테이블 형식(ingest 캐시 버전)이 바뀌어도 행 위치 인덱스가 달라질 수 있으므로 함께 구분
+    return os.path.join(ARTIFACT_DIR, f"{digest[:32]}-v{ARTIFACT_VERSION}-c{ingest.CACHE_VERSION}")
+
+
+def entry_file(filters, name):
+    """필터 조합과 결과 이름에 해당하는 아티팩트 파일명"""
+    program, companies, months = filters
+    key = json.dumps([program, list(companies), list(months), name], ensure_ascii=False)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:24] + '.pkl'
+
+
+def _read_pickle(path):
+    if not os.path.exists(os.path.join(os.path.dirname(path), 'manifest.json')) or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.warning("사전 계산 아티팩트를 읽지 못해 다시 계산합니다 (%s): %s", path, e)
+        return None
+
+
+def read_derived(digest):
+    """사전 계산한 인덱스 / 큐브 / 키워드 인덱스 / 프로그램 번들 dict (없으면 None)"""
+    return _read_pickle(os.path.join(artifact_path(digest), DERIVED_FILE))
+
+
+def read_artifact(digest, filters, name):
+    """사전 계산한 페이지 결과 (없으면 None)"""
+    return _read_pickle(os.path.join(artifact_path(digest), entry_file(filters, name)))
+
+
+def _write_pickle(path, value):
+    with open(path, 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_source(workbook=None, data_dir=None):
+    """워크북 또는 데이터 디렉터리를 읽어 (테이블 dict, 데이터 버전) 반환 (대시보드와 같은 버전 계산)"""
+    if data_dir is not None:
+        data, _, digest = ingest.load_directory(data_dir)
+        return data, digest
+    digest = ingest.file_digest(workbook)
+    data, _ = ingest.load_workbook(workbook, digest)
+    return data, digest
+
+
+# 작업 프로세스 상태 (프로세스마다 데이터를 한 번만 읽음)
+_worker_state = {}
+
+
+def _init_worker(source, derived_path):
+    data, _ = load_source(**source)
+    with open(derived_path, 'rb') as f:
+        derived = pickle.load(f)
+    _worker_state.update(data=data, derived=derived, filtered={})
+
+
+def compute_view(filters, names, out_dir):
+    """한 필터 조합의 페이지 결과(names, None 이면 전부)를 계산해 out_dir 에 저장하고 manifest 항목 목록 반환"""
+    filtered = _worker_state['filtered'].get(filters)
+    if filtered is None:
+        filtered = _worker_state['filtered'][filters] = filter_dataset(
+            _worker_state['data'], filters, _worker_state['derived'])
+    computes = page_results(filtered)
+
+    entries = []
+    for name in computes if names is None else names:
+        started = time.perf_counter()
+        file_name = entry_file(filters, name)
+        _write_pickle(os.path.join(out_dir, file_name), computes[name](filtered))
+        entries.append({'program': filters.program, 'companies': list(filters.companies),
+                        'months': list(filters.months), 'page': name, 'file': file_name,
+                        'seconds': round(time.perf_counter() - started, 4)})
+    return entries
+
+
+def precompute(workbook=None, data_dir=None, max_workers=None):
+    """필터 없는 화면과 프로그램별 화면의 모든 페이지 결과를 계산해 아티팩트 디렉터리에 저장
+
+    필터 없는 화면의 프로그램별 결과와 프로그램별 화면을 작업 단위로 나눠 프로세스 풀에서 계산합니다.
+    임시 디렉터리에 모두 쓴 뒤 이름을 바꾸므로 대시보드가 쓰다 만 아티팩트를 읽지 않습니다.
+    (아티팩트 경로, manifest dict) 를 반환합니다.
+    """
+    started = time.perf_counter()
+    source = {'workbook': workbook, 'data_dir': data_dir}
+    data, digest = load_source(**source)
+    derived = prepare_dataset(data)
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix='.tmp-', dir=ARTIFACT_DIR)
+    try:
+        derived_path = os.path.join(tmp_path, DERIVED_FILE)
+        _write_pickle(derived_path, derived)
+
+        # 작업 단위: 필터 없는 화면의 결과 묶음 + 프로그램별 화면
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        overall = list(page_results(filter_dataset(data, Filters(), derived)))
+        step = -(-len(overall) // workers)
+        tasks = [(Filters(), overall[i:i + step]) for i in range(0, len(overall), step)]
+        program_names = dict.fromkeys(data['program_info']['program_name'].dropna().tolist())
+        tasks += [(Filters(program=name), None) for name in program_names]
+
+        entries = []
+        if workers == 1:
+            _worker_state.update(data=data, derived=derived, filtered={})
+            for filters, names in tasks:
+                entries.extend(compute_view(filters, names, tmp_path))
+            _worker_state.clear()
+        else:
+            # Streamlit 과 무관한 CLI 이지만 load_directory 와 같이 spawn 으로 작업 프로세스 생성
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_worker, initargs=(source, derived_path)) as pool:
+                results = pool.map(compute_view, *zip(*tasks), [tmp_path] * len(tasks))
+                for result in results:
+                    entries.extend(result)
+
+        manifest = {
+            'digest': digest,
+            'artifact_version': ARTIFACT_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'programs': len(program_names),
+            'entries': entries,
+            'seconds': round(time.perf_counter() - started, 2),
+        }
+        with open(os.path.join(tmp_path, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+        path = artifact_path(digest)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    _prune_artifacts()
+    return path, manifest
+
+
+def _prune_artifacts():
+    """최근에 만든 ARTIFACT_KEEP 개만 남기고 오래된 아티팩트를 삭제합니다."""
+    entries = []
+    for name in os.listdir(ARTIFACT_DIR):
+        manifest_path = os.path.join(ARTIFACT_DIR, name, 'manifest.json')
+        if os.path.exists(manifest_path):
+            entries.append((os.path.getmtime(manifest_path), name))
+
+    for _, name in sorted(entries, reverse=True)[ARTIFACT_KEEP:]:
+        shutil.rmtree(os.path.join(ARTIFACT_DIR, name), ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='dashboard.py precompute', description="대시보드 화면 사전 계산")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--workbook', help="워크북 경로 (기본: dashboard_template.xlsx)")
+    source.add_argument('--data-dir', help="워크북 디렉터리 (대시보드의 DASHBOARD_DATA_DIR 모드)")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--artifact-dir', default=None, help="아티팩트 저장 위치 (기본: DASHBOARD_ARTIFACT_DIR)")
+    args = parser.parse_args(argv)
+
+    global ARTIFACT_DIR
+    if args.artifact_dir:
+        ARTIFACT_DIR = os.path.abspath(args.artifact_dir)
+    workbook = args.workbook
+    if workbook is None and args.data_dir is None:
+        workbook = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard_template.xlsx')
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    try:
+        path, manifest = precompute(workbook, args.data_dir, args.workers)
+    except (OSError, ingest.WorkbookError, ValueError) as e:
+        print(f"사전 계산 실패: {e}", file=sys.stderr)
+        return 1
+
+    print(f"프로그램 {manifest['programs']}개, 결과 {len(manifest['entries'])}개 ({manifest['seconds']}s)")
+    print(f"아티팩트 저장: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
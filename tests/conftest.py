@@ -0,0 +1,30 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ingest  # noqa: E402
+
+TEMPLATE = os.path.join(ROOT, 'dashboard_template.xlsx')
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 디스크 캐시 디렉터리 사용"""
+    path = tmp_path / 'cache'
+    monkeypatch.setattr(ingest, 'CACHE_DIR', str(path))
+    # spawn 으로 만든 작업 프로세스도 같은 위치를 사용
+    monkeypatch.setenv('DASHBOARD_CACHE_DIR', str(path))
+    return path
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """템플릿 워크북 복사본 경로"""
+    path = tmp_path / 'workbook.xlsx'
+    shutil.copyfile(TEMPLATE, path)
+    return str(path)
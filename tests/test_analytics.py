@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+from analytics import (OTHER_LABEL, Filters, cap_matrix, filter_dataset, overview_metrics, prepare_dataset,
+                       rating_stats, satisfaction_summary)
+from conftest import TEMPLATE
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    """템플릿 워크북 테이블과 prepare_dataset 결과 (디스크 캐시 없이 파싱)"""
+    data, _ = ingest.read_workbook(TEMPLATE)
+    ingest.derive_columns(data)
+    ingest.apply_schema(data)
+    return data, prepare_dataset(data)
+
+
+def mask_filter(data, filters):
+    """비교 기준: 테이블마다 불리언 마스크로 프로그램 / 회사 / 기간 필터를 적용"""
+    program, companies, months = filters
+    result = {key: data[key] for key in ingest.SHEETS}
+    if program != '전체':
+        program_info = data['program_info']
+        program_id = program_info[program_info['program_name'] == program]['program_id'].values[0]
+        for key in ingest.SHEETS:
+            result[key] = result[key][result[key]['program_id'] == program_id]
+    if len(companies) > 0:
+        for key in ['learners', 'survey']:
+            result[key] = result[key][result[key]['company'].isin(companies)]
+    if len(months) > 0:
+        program_info = result['program_info']
+        result['program_info'] = program_info[program_info['program_month'].dt.strftime('%Y-%m').isin(months)]
+        program_ids = result['program_info']['program_id'].unique()
+        for key in ingest.SHEETS:
+            result[key] = result[key][result[key]['program_id'].isin(program_ids)]
+    return result
+
+
+def filter_cases(data):
+    """프로그램별 / 회사별 / 연월별 필터와 조합"""
+    programs = data['program_info']['program_name'].tolist()
+    companies = data['learners']['company'].dropna().unique().tolist()
+    program_months = data['program_info']['program_month'].dt.strftime('%Y-%m').tolist()
+    months = sorted(set(program_months))
+    cases = [Filters()]
+    cases += [Filters(program=program) for program in programs]
+    cases += [Filters(companies=(company,)) for company in companies]
+    cases += [Filters(months=(month,)) for month in months]
+    cases += [
+        Filters(program=programs[0], companies=tuple(companies[:3])),
+        Filters(companies=tuple(companies[::2])),
+        Filters(months=tuple(months[:3])),
+        Filters(companies=tuple(companies[:5]), months=tuple(months[1::2])),
+        # 프로그램과 연월이 맞는 경우 / 맞지 않아 결과가 빈 경우
+        Filters(program=programs[0], months=(program_months[0],)),
+        Filters(program=programs[0], months=tuple(month for month in months if month != program_months[0])),
+        Filters(program=programs[-1], companies=tuple(companies[:10]), months=(program_months[-1],)),
+    ]
+    return cases
+
+
+def test_filter_dataset_rows_match_mask_filter(dataset):
+    data, derived = dataset
+    for filters in filter_cases(data):
+        filtered, expected = filter_dataset(data, filters, derived), mask_filter(data, filters)
+        for key in ingest.SHEETS:
+            pd.testing.assert_frame_equal(filtered[key], expected[key], obj=f"{filters} {key}")
+
+
+def reference_stats(survey, by):
+    """비교 기준: 설문 행에서 직접 계산한 그룹별 평점 평균 / 표준편차 / 응답 수 (응답이 없는 그룹 제외)"""
+    rated = survey[survey['rating'].notna()]
+    grouped = rated.assign(rating=rated['rating'].astype('float64')).groupby(by, observed=True)['rating']
+    return grouped.agg(['mean', 'std', 'count'])
+
+
+def assert_same_stats(stats, survey, by, obj):
+    expected = reference_stats(survey, by)
+    stats = stats.set_index(by)[['mean', 'std', 'count']]
+    if isinstance(by, list):
+        stats = stats.reset_index().set_index(by)
+    pd.testing.assert_frame_equal(stats.sort_index(), expected.sort_index(), check_dtype=False,
+                                  check_index_type=False, check_categorical=False, obj=obj)
+
+
+def test_overview_kpis_match_mask_filter(dataset):
+    data, derived = dataset
+    for filters in filter_cases(data):
+        filtered, expected = filter_dataset(data, filters, derived), mask_filter(data, filters)
+        result = overview_metrics(filtered)
+        kpis, budget, survey = result['kpis'], expected['budget'], expected['survey']
+
+        assert kpis['programs'] == len(expected['program_info']), filters
+        assert kpis['learners'] == len(expected['learners']), filters
+        assert kpis['budget'] == pytest.approx(budget['actual_budget'].sum() / 1000000), filters
+        assert kpis['direct_cost'] == pytest.approx(budget['total_direct_cost'].sum() / 1000000), filters
+        satisfaction = survey['rating'].astype('float64').mean() if len(survey) > 0 else 0
+        assert kpis['satisfaction'] == pytest.approx(satisfaction, nan_ok=True), filters
+
+        months = expected['program_info']['program_month'].dt.month.value_counts()
+        monthly = result['monthly'].set_index('month')['프로그램 수']
+        assert monthly.to_dict() == {month: months.get(month, 0) for month in range(1, 13)}, filters
+
+        summary = expected['program_info'].merge(budget, on='program_id')
+        ratings = survey.assign(rating=survey['rating'].astype('float64')).groupby('program_id', observed=True)['rating'].mean()
+        np.testing.assert_allclose(result['summary']['만족도'].to_numpy(dtype=float),
+                                   summary['program_id'].map(ratings).round(2).to_numpy(dtype=float),
+                                   err_msg=str(filters))
+
+
+def test_slice_cube_totals_match_mask_filter(dataset):
+    data, derived = dataset
+    for filters in filter_cases(data):
+        cube, expected = filter_dataset(data, filters, derived)['cube'], mask_filter(data, filters)
+        learners, survey = expected['learners'], expected['survey']
+        ratings = survey['rating'].dropna().astype('float64')
+
+        assert cube['learners']['count'].sum() == len(learners), filters
+        by_program = cube['learners'].groupby('program_id', observed=True)['count'].sum()
+        counts = learners['program_id'].value_counts()
+        assert by_program[by_program > 0].to_dict() == counts[counts > 0].to_dict(), filters
+        assert cube['survey']['count'].sum() == len(ratings), filters
+        assert cube['survey']['rating_sum'].sum() == pytest.approx(ratings.sum()), filters
+        assert cube['survey']['rating_sq_sum'].sum() == pytest.approx((ratings ** 2).sum()), filters
+        distribution = cube['ratings'].groupby('rating')['count'].sum()
+        counts = survey['rating'].value_counts()
+        assert distribution[distribution > 0].to_dict() == counts[counts > 0].to_dict(), filters
+        assert cube['instructors']['lecture_fee'].sum() == pytest.approx(expected['instructors']['lecture_fee'].sum())
+        assert cube['programs']['count'].sum() == len(expected['program_info']), filters
+
+
+def test_rating_stats_match_mask_filter(dataset):
+    data, derived = dataset
+    for filters in filter_cases(data):
+        filtered, expected = filter_dataset(data, filters, derived), mask_filter(data, filters)
+        survey = expected['survey']
+        for by in ['program_id', 'company', 'question_id']:
+            assert_same_stats(rating_stats(filtered['cube']['survey'], by), survey, by, f"{filters} {by}")
+
+        overall = satisfaction_summary(filtered)
+        rated = survey['rating'].dropna().astype('float64')
+        assert overall['overall'] == pytest.approx(rated.mean() if len(rated) > 0 else np.nan, nan_ok=True)
+        assert_same_stats(overall['by_question'], survey, 'question_id', f"{filters} by_question")
+
+
+def test_program_satisfaction_matches_mask_filter(dataset):
+    data, derived = dataset
+    filtered = filter_dataset(data, Filters(), derived)
+    for program in data['program_info']['program_name']:
+        survey = mask_filter(data, Filters(program=program))['survey']
+        result = satisfaction_summary(filtered, program)
+        objective = survey[survey['question_type'] == '객관식']
+        assert_same_stats(result['questions'], objective, ['question_id', 'question_text'], program)
+        assert result['distribution']['count'].sum() == survey['rating'].notna().sum(), program
+
+
+def test_cap_matrix_keeps_largest_rows_and_columns():
+    rng = np.random.default_rng(0)
+    matrix = pd.DataFrame(rng.integers(0, 5, (300, 40)),
+                          index=[f"회사{i}" for i in range(300)], columns=[f"P{j}" for j in range(40)])
+    matrix.loc['회사7'] += 100
+
+    capped = cap_matrix(matrix, 1000)
+
+    assert capped.size <= 1000
+    assert capped.index[-1] == OTHER_LABEL and capped.columns[-1] == OTHER_LABEL
+    assert capped.index[0] == '회사7'
+    assert capped.to_numpy().sum() == matrix.to_numpy().sum()
+    # 남긴 셀의 값은 그대로
+    kept_rows, kept_columns = capped.index[:-1], capped.columns[:-1]
+    pd.testing.assert_frame_equal(capped.loc[kept_rows, kept_columns].astype(matrix.dtypes.iloc[0]),
+                                  matrix.loc[kept_rows, kept_columns])
+
+
+def test_cap_matrix_leaves_small_matrix_unchanged():
+    matrix = pd.DataFrame(np.ones((10, 5)))
+    assert cap_matrix(matrix, 50) is matrix
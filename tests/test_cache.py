@@ -0,0 +1,21 @@
+import os
+
+import pandas as pd
+
+import ingest
+
+
+def test_write_cache_replaces_corrupt_entry(workbook):
+    data, _ = ingest.load_workbook(workbook)
+    digest = ingest.file_digest(workbook)
+    path = ingest._cache_path(digest)
+    with open(os.path.join(path, 'survey.feather'), 'wb') as f:
+        f.write(b'corrupt')
+    assert ingest.read_cache(digest) is None
+
+    ingest.load_workbook(workbook, digest)
+
+    cached = ingest.read_cache(digest)
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached['survey'], data['survey'])
+    assert [name for name in os.listdir(ingest.CACHE_DIR) if name.startswith('.tmp-')] == []
@@ -0,0 +1,62 @@
+import logging
+import os
+import shutil
+import zipfile
+
+import ingest
+from conftest import TEMPLATE
+
+
+def make_directory(path, count):
+    """내용(파일 해시)이 서로 다른 템플릿 복사본 count 개를 만든 디렉터리"""
+    path.mkdir()
+    for i in range(count):
+        target = path / f"workbook{i}.xlsx"
+        shutil.copyfile(TEMPLATE, target)
+        with zipfile.ZipFile(target, 'a') as archive:
+            archive.comment = f"copy {i}".encode('ascii')
+    return str(path)
+
+
+def test_load_directory_keeps_every_workbook_cache(tmp_path, caplog):
+    # 작업 프로세스는 모듈의 CACHE_KEEP 을 쓰므로 실제 값보다 많은 워크북으로 확인
+    count = ingest.CACHE_KEEP + 2
+    directory = make_directory(tmp_path / 'workbooks', count)
+
+    data, _, digest = ingest.load_directory(directory, max_workers=2)
+    paths = ingest.list_workbooks(directory)
+    assert all(os.path.exists(ingest._cache_path(ingest.file_digest(path))) for path in paths)
+    assert data['program_info']['source'].nunique() == count
+
+    with caplog.at_level(logging.INFO, logger='ingest'):
+        again, _, again_digest = ingest.load_directory(directory, max_workers=2)
+    assert again_digest == digest
+    assert "새로 파싱 0개" in caplog.text
+
+
+def test_single_workbook_load_still_prunes(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, 'CACHE_KEEP', 2)
+    directory = make_directory(tmp_path / 'workbooks', 3)
+    for path in ingest.list_workbooks(directory):
+        ingest.load_workbook(path)
+
+    assert len(os.listdir(ingest.CACHE_DIR)) == 2
+
+
+def test_load_directory_when_cache_appears_after_miss(tmp_path, monkeypatch):
+    # 다른 프로세스가 read_cache 확인 직후 같은 워크북의 캐시를 저장한 경우
+    directory = make_directory(tmp_path / 'workbooks', 1)
+    ingest.load_workbook(ingest.list_workbooks(directory)[0])
+    read_cache, misses = ingest.read_cache, []
+
+    def miss_once(digest):
+        if not misses:
+            misses.append(digest)
+            return None
+        return read_cache(digest)
+    monkeypatch.setattr(ingest, 'read_cache', miss_once)
+
+    data, timings, _ = ingest.load_directory(directory)
+
+    assert misses and timings['workbook0'] >= 0
+    assert len(data['program_info']) > 0
@@ -0,0 +1,61 @@
+import os
+
+import openpyxl
+import pandas as pd
+
+import ingest
+
+
+def save_copy(source, target, edit=None):
+    """openpyxl 로 다시 저장한 워크북 (edit(workbook) 으로 셀 수정)"""
+    workbook = openpyxl.load_workbook(source)
+    if edit is not None:
+        edit(workbook)
+    workbook.save(target)
+    return str(target)
+
+
+def edit_late_row(workbook):
+    # 마지막 프로그램(P025) 행의 교육 인원
+    workbook['Program_Info']['H26'] = 99
+
+
+def test_sheet_digests_detect_late_row_edit(workbook, tmp_path):
+    before = save_copy(workbook, tmp_path / 'before.xlsx')
+    after = save_copy(workbook, tmp_path / 'after.xlsx', edit_late_row)
+
+    old, new = ingest.sheet_digests(before), ingest.sheet_digests(after)
+    assert {key for key in ingest.SHEETS if old[key] != new[key]} == {'program_info'}
+
+
+def test_reload_workbook_matches_full_load(workbook, tmp_path):
+    before = save_copy(workbook, tmp_path / 'before.xlsx')
+    after = save_copy(workbook, tmp_path / 'after.xlsx', edit_late_row)
+    previous, _ = ingest.load_workbook(before)
+    old, new = ingest.sheet_digests(before), ingest.sheet_digests(after)
+    changed_sheets = {key for key in ingest.SHEETS if old[key] != new[key]}
+
+    data, _, changed = ingest.reload_workbook(after, previous, changed_sheets)
+
+    assert 'program_info' in changed and 'learners' not in changed
+    assert data['learners'] is previous['learners']
+    row = data['program_info'].set_index('program_id').loc['P025']
+    assert row['num_learners'] == 99
+    expected, _ = ingest.read_workbook(after)
+    ingest.derive_columns(expected)
+    ingest.apply_schema(expected)
+    for key in ingest.SHEETS:
+        pd.testing.assert_frame_equal(data[key], expected[key])
+
+
+def test_reload_workbook_without_changed_sheets_parses_everything(workbook, tmp_path):
+    before = save_copy(workbook, tmp_path / 'before.xlsx')
+    after = save_copy(workbook, tmp_path / 'after.xlsx', edit_late_row)
+    previous, _ = ingest.load_workbook(before)
+    digest = ingest.file_digest(after)
+
+    data, _, changed = ingest.reload_workbook(after, previous, set(), digest)
+
+    assert changed == set(ingest.SHEETS)
+    assert data['program_info'].set_index('program_id').loc['P025', 'num_learners'] == 99
+    assert not os.path.exists(ingest._cache_path(digest))
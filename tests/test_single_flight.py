@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from coalesce import SingleFlight
+
+
+def run_concurrently(flight, key, func, callers):
+    """callers 개 스레드에서 동시에 flight.do(key, func) 를 호출하고 (결과 목록, 예외 목록) 반환"""
+    barrier = threading.Barrier(callers)
+    results, errors = [], []
+
+    def call():
+        barrier.wait()
+        try:
+            results.append(flight.do(key, func))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results, errors
+
+
+def slow(value, started, release):
+    """started 를 알리고 release 될 때까지 기다렸다가 value 반환하는 계산"""
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=10)
+        return value
+    return func, calls
+
+
+def release_after_start(started, release):
+    def wait_and_release():
+        started.wait(timeout=10)
+        # 나머지 호출이 진행 중인 계산에 합류할 시간
+        time.sleep(0.2)
+        release.set()
+    threading.Thread(target=wait_and_release).start()
+
+
+def test_concurrent_callers_share_one_computation():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    result = object()
+    func, calls = slow(result, started, release)
+    release_after_start(started, release)
+
+    results, errors = run_concurrently(flight, ('page', 'overview'), func, 16)
+
+    assert not errors and len(results) == 16
+    assert len(calls) == 1
+    assert all(value is result for value, _ in results)
+    assert sorted(coalesced for _, coalesced in results) == [False] + [True] * 15
+    assert flight.snapshot() == {'in_flight': 0, 'page': {'computed': 1, 'coalesced': 15}}
+
+
+def test_followers_compute_when_leader_fails():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=10)
+            raise RuntimeError("leader failed")
+        return 'ok'
+    release_after_start(started, release)
+
+    results, errors = run_concurrently(flight, ('filter', 'all'), func, 4)
+
+    assert [str(e) for e in errors] == ["leader failed"]
+    assert results == [('ok', False)] * 3
+    assert flight.counters['filter'] == {'computed': 4, 'coalesced': 0}
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do(('page', 'a'), lambda: 1) == (1, False)
+    assert flight.do(('page', 'b'), lambda: 2) == (2, False)
+    # 끝난 계산의 결과는 보관하지 않음 (캐시는 호출한 쪽에서 관리)
+    assert flight.do(('page', 'a'), lambda: 3) == (3, False)
+    with pytest.raises(ValueError):
+        flight.do(('page', 'a'), lambda: int('x'))
+    assert flight.snapshot()['in_flight'] == 0
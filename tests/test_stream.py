@@ -0,0 +1,34 @@
+import openpyxl
+import pandas as pd
+import pytest
+
+import ingest
+from conftest import TEMPLATE
+
+
+@pytest.mark.parametrize('key', list(ingest.SHEETS))
+def test_stream_sheet_matches_read_excel(key):
+    columns, dtypes = ingest.SHEET_COLUMNS[key], ingest.SHEET_DTYPES[key]
+    expected = pd.read_excel(TEMPLATE, sheet_name=ingest.SHEETS[key], dtype=dtypes,
+                             usecols=lambda column: column in columns)
+
+    workbook = openpyxl.load_workbook(TEMPLATE, read_only=True, data_only=True)
+    try:
+        # 여러 청크로 나뉘도록 작은 chunk_rows 사용
+        streamed = ingest.stream_sheet(workbook[ingest.SHEETS[key]], columns, dtypes, chunk_rows=7)
+    finally:
+        workbook.close()
+
+    assert list(streamed.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_streaming_and_pandas_ingest_match_after_schema():
+    streamed, _ = ingest.read_workbook(TEMPLATE, streaming=True)
+    parsed, _ = ingest.read_workbook(TEMPLATE, streaming=False)
+    for data in (streamed, parsed):
+        ingest.derive_columns(data)
+        ingest.apply_schema(data)
+
+    for key in ingest.SHEETS:
+        pd.testing.assert_frame_equal(streamed[key], parsed[key])